@@ -1,23 +1,73 @@
 """Best-effort dispatch client for Fulcrum runtime."""
 
-import json
+import functools
 import os
+import queue
+import sys
+import threading
+import time
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import httpx
 from pydantic import BaseModel
 
 from fulcrum_sdk._internal.dispatch.models import (
+    KIND_MAX_LENGTH,
     PAYLOAD_MAX_SIZE_BYTES,
     SCHEMA_VERSION,
+    SOURCE_MAX_LENGTH,
     SUMMARY_MAX_LENGTH,
-    DispatchEntry,
 )
-from fulcrum_sdk._internal.dispatch.redaction import redact_payload
+from fulcrum_sdk._internal.dispatch.redaction import encode_redacted, redact_query
+from fulcrum_sdk._internal.http import (
+    DISPATCH_LIMITS,
+    RUNTIME_CONNECT_TIMEOUT,
+    cancel_close_at_exit,
+    close_at_exit,
+    create_http_client,
+)
+from fulcrum_sdk._internal.serialization import append_field, dumps
+
+if TYPE_CHECKING:
+    import httpx
 
 DEFAULT_TIMEOUT_MS = 1500
 DEFAULT_MAX_BYTES = PAYLOAD_MAX_SIZE_BYTES
+QUEUE_MAX_SIZE = 1024
+FLUSH_TIMEOUT_S = 2.0
+MAX_BATCH_SIZE = 32
+BATCH_WINDOW_S = 0.05
+
+# Maps line breaks to spaces to keep summaries on a single line
+_NEWLINE_TABLE = str.maketrans({"\n": " ", "\r": " "})
+
+# Encoded entry fields that follow "source", ending at the client_ts key
+_SCHEMA_VERSION_FIELD = b',"schema_version":' + dumps(SCHEMA_VERSION) + b',"client_ts":'
+
+# Queued by close() to stop the background worker
+_STOP = object()
+
+# (epoch second, ISO prefix for that second) of the last generated timestamp
+_ts_cache: tuple[int, str] = (0, "")
+
+
+def _discard_debug(message: str, *args: Any) -> None:
+    """Drop a debug message; used as `_log_debug` when debug mode is off."""
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time as an ISO 8601 string with microseconds.
+
+    The date and time-of-day prefix is formatted once per second; later calls
+    in the same second only append the fraction.
+    """
+    global _ts_cache
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    cached_sec, prefix = _ts_cache
+    if sec != cached_sec:
+        prefix = datetime.fromtimestamp(sec, UTC).strftime("%Y-%m-%dT%H:%M:%S")
+        _ts_cache = (sec, prefix)
+    return f"{prefix}.{ns // 1000:06d}+00:00"
 
 
 class DispatchClient:
@@ -30,6 +80,32 @@ class DispatchClient:
     If required environment variables are missing, a no-op client is returned.
     """
 
+    __slots__ = (
+        "_dispatch_url",
+        "_dispatch_token",
+        "_ticket_uuid",
+        "_run_uuid",
+        "_message_uuid",
+        "_entry_prefix",
+        "_source_key",
+        "_timeout_ms",
+        "_max_bytes",
+        "_debug",
+        "_log_debug",
+        "_enabled",
+        "_headers",
+        "_client",
+        "_client_lock",
+        "_transport",
+        "_background",
+        "_batch_url",
+        "_queue",
+        "_worker",
+        "_worker_lock",
+        # Lets the exit hook hold the client weakly; see close_at_exit()
+        "__weakref__",
+    )
+
     def __init__(
         self,
         *,
@@ -41,6 +117,9 @@ class DispatchClient:
         timeout_ms: int = DEFAULT_TIMEOUT_MS,
         max_bytes: int = DEFAULT_MAX_BYTES,
         debug: bool = False,
+        background: bool = False,
+        batch_url: str | None = None,
+        transport: "httpx.BaseTransport | None" = None,
     ) -> None:
         """Initialize the dispatch client.
 
@@ -53,21 +132,56 @@ class DispatchClient:
             timeout_ms: Request timeout in milliseconds.
             max_bytes: Maximum payload size in bytes.
             debug: Enable debug logging to stderr.
+            background: Send entries from a background thread instead of
+                blocking the caller. Dispatch methods then return True once
+                the entry is queued.
+            batch_url: Optional batch endpoint. In background mode, queued
+                entries are coalesced into `{"entries": [...]}` posts to it.
+            transport: Optional httpx transport for the pooled client, e.g. an
+                httpx.MockTransport to capture requests in tests.
         """
         self._dispatch_url = dispatch_url
         self._dispatch_token = dispatch_token
         self._ticket_uuid = ticket_uuid
         self._run_uuid = run_uuid
         self._message_uuid = message_uuid
+        # The run identifiers never change, so their part of the encoded entry
+        # is built once; see dispatch() for the full field order
+        self._entry_prefix = (
+            b'{"ticket_uuid":'
+            + dumps(ticket_uuid)
+            + b',"run_uuid":'
+            + dumps(run_uuid)
+            + b',"kind":'
+        )
+        self._source_key = b',"source":'
+        if message_uuid is not None:
+            self._source_key = b',"message_uuid":' + dumps(message_uuid) + self._source_key
         self._timeout_ms = timeout_ms
         self._max_bytes = max_bytes
         self._debug = debug
-        self._enabled = all([dispatch_url, dispatch_token, ticket_uuid, run_uuid])
+        self._log_debug = self._write_debug if debug else _discard_debug
+        self._enabled = bool(dispatch_url and dispatch_token and ticket_uuid and run_uuid)
+        self._headers = {
+            "Authorization": f"Bearer {dispatch_token}",
+            "Content-Type": "application/json",
+        }
+        self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
+        self._transport = transport
+        self._background = background
+        self._batch_url = batch_url
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=QUEUE_MAX_SIZE)
+        self._worker: threading.Thread | None = None
+        self._worker_lock = threading.Lock()
 
     @classmethod
     def from_env(cls) -> "DispatchClient":
         """Create a dispatch client from environment variables.
 
+        The environment is read on every call, so variables set after import
+        are picked up. Use `get_dispatch_client()` to read it once per process.
+
         Required environment variables:
             FULCRUM_DISPATCH_URL: The dispatch API endpoint URL.
             FULCRUM_RUN_TOKEN: The authentication token (preferred).
@@ -80,23 +194,26 @@ class DispatchClient:
             FULCRUM_DISPATCH_DEBUG: Set to "1" to enable debug logging.
             FULCRUM_DISPATCH_TIMEOUT_MS: Request timeout in milliseconds.
             FULCRUM_DISPATCH_MAX_BYTES: Maximum payload size in bytes.
+            FULCRUM_DISPATCH_BACKGROUND: Set to "1" to send from a background thread.
+            FULCRUM_DISPATCH_BATCH_URL: Batch endpoint used in background mode.
 
         Returns:
             A configured DispatchClient. If required env vars are missing,
             returns a no-op client (all dispatch methods return False).
         """
-        dispatch_url = os.environ.get("FULCRUM_DISPATCH_URL")
+        env = os.environ
+        dispatch_url = env.get("FULCRUM_DISPATCH_URL")
         # Prefer FULCRUM_RUN_TOKEN, fallback to deprecated FULCRUM_DISPATCH_TOKEN
-        dispatch_token = os.environ.get("FULCRUM_RUN_TOKEN") or os.environ.get(
-            "FULCRUM_DISPATCH_TOKEN"
-        )
-        ticket_uuid = os.environ.get("FULCRUM_TICKET_UUID")
-        run_uuid = os.environ.get("FULCRUM_RUN_UUID")
-        message_uuid = os.environ.get("FULCRUM_MESSAGE_UUID")
+        dispatch_token = env.get("FULCRUM_RUN_TOKEN") or env.get("FULCRUM_DISPATCH_TOKEN")
+        ticket_uuid = env.get("FULCRUM_TICKET_UUID")
+        run_uuid = env.get("FULCRUM_RUN_UUID")
+        message_uuid = env.get("FULCRUM_MESSAGE_UUID")
 
-        debug = os.environ.get("FULCRUM_DISPATCH_DEBUG", "") == "1"
-        timeout_ms = int(os.environ.get("FULCRUM_DISPATCH_TIMEOUT_MS", str(DEFAULT_TIMEOUT_MS)))
-        max_bytes = int(os.environ.get("FULCRUM_DISPATCH_MAX_BYTES", str(DEFAULT_MAX_BYTES)))
+        debug = env.get("FULCRUM_DISPATCH_DEBUG") == "1"
+        timeout_ms = int(env.get("FULCRUM_DISPATCH_TIMEOUT_MS", DEFAULT_TIMEOUT_MS))
+        max_bytes = int(env.get("FULCRUM_DISPATCH_MAX_BYTES", DEFAULT_MAX_BYTES))
+        background = env.get("FULCRUM_DISPATCH_BACKGROUND") == "1"
+        batch_url = env.get("FULCRUM_DISPATCH_BATCH_URL")
 
         return cls(
             dispatch_url=dispatch_url,
@@ -107,6 +224,8 @@ class DispatchClient:
             timeout_ms=timeout_ms,
             max_bytes=max_bytes,
             debug=debug,
+            background=background,
+            batch_url=batch_url,
         )
 
     @property
@@ -114,12 +233,146 @@ class DispatchClient:
         """Check if the client is properly configured and enabled."""
         return self._enabled
 
-    def _log_debug(self, message: str) -> None:
-        """Log a debug message to stderr if debug mode is enabled."""
-        if self._debug:
-            import sys
+    def close(self) -> None:
+        """Drain queued entries and close the pooled HTTP connection.
+
+        Waits at most FLUSH_TIMEOUT_S for the background worker. Safe to call
+        more than once.
+        """
+        cancel_close_at_exit(self)
+        with self._worker_lock:
+            worker, self._worker = self._worker, None
+        if worker is not None:
+            deadline = time.monotonic() + FLUSH_TIMEOUT_S
+            try:
+                self._queue.put(_STOP, timeout=FLUSH_TIMEOUT_S)
+                worker.join(max(0.0, deadline - time.monotonic()))
+            except queue.Full:
+                self._log_debug("Dispatch queue did not drain before close")
+        with self._client_lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    def flush(self, timeout: float = FLUSH_TIMEOUT_S) -> bool:
+        """Wait until entries queued so far have been sent.
+
+        Args:
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            True if the queue drained in time (or nothing was queued), False otherwise.
+        """
+        if self._worker is None:
+            return True
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def __enter__(self) -> "DispatchClient":
+        """Return the client for use in a with block."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Drain queued entries and close the pooled HTTP connection."""
+        self.close()
+
+    def _get_client(self) -> "httpx.Client":
+        """Return the pooled HTTP client, creating it on first use.
+
+        The background worker and caller threads can both get here first, so
+        creation is locked to keep a second pool from being built and leaked.
+        """
+        client = self._client
+        if client is None:
+            with self._client_lock:
+                client = self._client
+                if client is None:
+                    self._client = client = create_http_client(
+                        timeout=self._timeout_ms / 1000,
+                        connect_timeout=RUNTIME_CONNECT_TIMEOUT,
+                        headers=self._headers,
+                        limits=DISPATCH_LIMITS,
+                        http2=True,
+                        transport=self._transport,
+                    )
+                    close_at_exit(self)
+        return client
+
+    def _enqueue(self, body: bytes) -> bool:
+        """Queue an encoded entry for the background worker."""
+        if self._worker is None:
+            self._start_worker()
+        try:
+            self._queue.put_nowait(body)
+        except queue.Full:
+            self._log_debug("Dispatch queue full, dropping entry")
+            return False
+        return True
+
+    def _start_worker(self) -> None:
+        """Start the background worker thread if it is not running."""
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._drain_loop, name="fulcrum-dispatch", daemon=True
+                )
+                self._worker.start()
+                close_at_exit(self)
+
+    def _drain_loop(self) -> None:
+        """Send queued entries until the stop sentinel is received."""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            if isinstance(item, threading.Event):
+                item.set()
+                continue
+            if self._batch_url is None:
+                self._post(self._dispatch_url, item)  # type: ignore[arg-type]
+                continue
+
+            batch = [item]
+            control = self._collect_batch(batch)
+            self._send_batch(batch)
+            if control is _STOP:
+                return
+            if control is not None:
+                control.set()
+
+    def _collect_batch(self, batch: list[bytes]) -> Any:
+        """Fill a batch until MAX_BATCH_SIZE entries or BATCH_WINDOW_S elapses.
 
-            print(f"[fulcrum-sdk] {message}", file=sys.stderr)
+        Returns:
+            The stop sentinel or flush event that cut the batch short, if any.
+        """
+        deadline = time.monotonic() + BATCH_WINDOW_S
+        while len(batch) < MAX_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _STOP or isinstance(item, threading.Event):
+                return item
+            batch.append(item)
+        return None
+
+    def _write_debug(self, message: str, *args: Any) -> None:
+        """Log a debug message to stderr.
+
+        Bound as `_log_debug` in debug mode; otherwise `_log_debug` discards
+        messages without checking the flag on every call. `message` is
+        %-formatted with `args` only here, so callers pass arguments rather
+        than pre-formatted strings.
+        """
+        print(f"[fulcrum-sdk] {message % args if args else message}", file=sys.stderr)
 
     def dispatch(
         self,
@@ -138,86 +391,101 @@ class DispatchClient:
         Args:
             kind: Classification of the dispatch (e.g., 'text', 'api_call', 'db').
             summary: Human-readable summary, <= 512 chars, single line.
-            payload: Optional structured data (will be redacted unless skip_redaction=True).
+            payload: Optional JSON-serializable data (will be redacted unless
+                skip_redaction=True). See `serialization` for supported types.
             source: Origin of the dispatch (default: "sdk").
             client_ts: Client timestamp (ISO string). Defaults to current time.
             skip_redaction: If True, skip automatic redaction of sensitive keys.
 
         Returns:
-            True if the dispatch was sent successfully, False otherwise.
+            True if the dispatch was sent successfully (or queued, in background
+            mode), False otherwise.
         """
         if not self._enabled:
             self._log_debug("Client not enabled, skipping dispatch")
             return False
 
         try:
-            # Truncate summary if too long
+            # Enforce the DispatchEntry constraints without building the model
+            if not kind or len(kind) > KIND_MAX_LENGTH:
+                self._log_debug("Invalid dispatch kind: %r", kind[:KIND_MAX_LENGTH])
+                return False
+            if len(source) > SOURCE_MAX_LENGTH:
+                self._log_debug("Invalid dispatch source: %r", source[:SOURCE_MAX_LENGTH])
+                return False
+
+            # Ensure single line, then truncate if too long
+            summary = summary.translate(_NEWLINE_TABLE)
             if len(summary) > SUMMARY_MAX_LENGTH:
                 summary = summary[: SUMMARY_MAX_LENGTH - 3] + "..."
 
-            # Redact and truncate payload
-            processed_payload: dict[str, Any] | None = None
+            # Encode the entry in DispatchEntry field order, omitting None
+            # fields, around the pre-encoded constant fields; the payload
+            # goes last (below) rather than in its model position. Encoding
+            # now means later changes to the caller's payload can't leak into
+            # a queued entry.
+            body = b"".join((
+                self._entry_prefix,
+                dumps(kind),
+                b',"summary":',
+                dumps(summary),
+                self._source_key,
+                dumps(source),
+                _SCHEMA_VERSION_FIELD,
+                dumps(client_ts or _utc_timestamp()),
+                b"}",
+            ))
             if payload is not None:
-                processed_payload = redact_payload(payload, skip_redaction=skip_redaction)
-                processed_payload = self._truncate_payload(processed_payload)
-
-            # Build the entry
-            entry = DispatchEntry(
-                ticket_uuid=self._ticket_uuid,  # type: ignore[arg-type]
-                run_uuid=self._run_uuid,  # type: ignore[arg-type]
-                kind=kind,
-                summary=summary.replace("\n", " "),  # Ensure single line
-                message_uuid=self._message_uuid,
-                payload=processed_payload,
-                source=source,
-                schema_version=SCHEMA_VERSION,
-                client_ts=client_ts or datetime.now(UTC).isoformat(),
-            )
+                # Redact, encode and truncate the payload, then splice it into
+                # the encoded entry as the last field
+                payload_bytes = encode_redacted(payload, skip_redaction=skip_redaction)
+                body = append_field(body, "payload", self._truncate_payload(payload_bytes))
 
             # Send the request
-            self._log_debug(f"Sending dispatch: {entry.kind} - {entry.summary[:50]}")
-            return self._send(entry)
+            self._log_debug("Sending dispatch: %s - %.50s", kind, summary)
+            if self._background:
+                return self._enqueue(body)
+            return self._post(self._dispatch_url, body)  # type: ignore[arg-type]
 
         except Exception as e:
-            self._log_debug(f"Dispatch failed: {e}")
+            self._log_debug("Dispatch failed: %s", e)
             return False
 
-    def _truncate_payload(self, payload: dict[str, Any]) -> dict[str, Any]:
-        """Truncate payload if it exceeds max bytes."""
-        payload_json = json.dumps(payload, default=str)
-        if len(payload_json.encode("utf-8")) <= self._max_bytes:
+    def _truncate_payload(self, payload: bytes) -> bytes:
+        """Replace an encoded payload with a truncation notice if it exceeds max bytes."""
+        if len(payload) <= self._max_bytes:
             return payload
 
         # Payload too large - return a truncation notice
-        return {
+        return dumps({
             "_truncated": True,
-            "_original_size": len(payload_json.encode("utf-8")),
+            "_original_size": len(payload),
             "_max_size": self._max_bytes,
-        }
+        })
+
+    def _send_batch(self, bodies: list[bytes]) -> bool:
+        """Send several encoded entries to the batch endpoint in one request."""
+        self._log_debug("Sending batch of %d dispatches", len(bodies))
+        body = b'{"entries":[' + b",".join(bodies) + b"]}"
+        return self._post(self._batch_url, body)  # type: ignore[arg-type]
+
+    def _post(self, url: str, body: bytes) -> bool:
+        """Post an encoded body to the API."""
+        import httpx
 
-    def _send(self, entry: DispatchEntry) -> bool:
-        """Send the dispatch entry to the API."""
         try:
-            with httpx.Client(timeout=self._timeout_ms / 1000) as client:
-                response = client.post(
-                    self._dispatch_url,  # type: ignore[arg-type]
-                    json=entry.model_dump(mode="json", exclude_none=True),
-                    headers={
-                        "Authorization": f"Bearer {self._dispatch_token}",
-                        "Content-Type": "application/json",
-                    },
-                )
-                if response.status_code >= 200 and response.status_code < 300:
-                    self._log_debug("Dispatch succeeded")
-                    return True
-                else:
-                    self._log_debug(f"Dispatch failed with status {response.status_code}")
-                    return False
+            response = self._get_client().post(url, content=body)
+            if response.is_success:
+                self._log_debug("Dispatch succeeded")
+                return True
+            else:
+                self._log_debug("Dispatch failed with status %d", response.status_code)
+                return False
         except httpx.TimeoutException:
             self._log_debug("Dispatch timed out")
             return False
         except Exception as e:
-            self._log_debug(f"Dispatch error: {e}")
+            self._log_debug("Dispatch error: %s", e)
             return False
 
     # =========================================================================
@@ -235,7 +503,8 @@ class DispatchClient:
             True if dispatch succeeded, False otherwise.
         """
         payload = {"text": text} if text is not None else None
-        return self.dispatch("text", summary, payload)
+        # The payload keys are fixed and never sensitive
+        return self.dispatch("text", summary, payload, skip_redaction=True)
 
     def dispatch_json(self, summary: str, payload: dict[str, Any]) -> bool:
         """Dispatch a JSON data event.
@@ -297,7 +566,8 @@ class DispatchClient:
         }
         if url is not None:
             payload["url"] = url
-        return self.dispatch("external_ref", summary, payload)
+        # The payload keys are fixed and never sensitive
+        return self.dispatch("external_ref", summary, payload, skip_redaction=True)
 
     def dispatch_db(
         self,
@@ -323,8 +593,9 @@ class DispatchClient:
         if rows is not None:
             payload["count"] = rows
         if query is not None:
-            payload["query"] = query
-        return self.dispatch("db", summary, payload)
+            payload["query"] = redact_query(query)
+        # The payload keys are fixed; only the query text can carry secrets
+        return self.dispatch("db", summary, payload, skip_redaction=True)
 
     def dispatch_model(
         self,
@@ -342,15 +613,15 @@ class DispatchClient:
         Returns:
             True if dispatch succeeded, False otherwise.
         """
-        payload: dict[str, Any] = {
-            "model_name": model.__class__.__name__,
-            "data": model.model_dump(mode="json"),
-        }
+        # The encoder serializes the model with its own compiled serializer,
+        # so there is no intermediate model_dump() dict.
+        payload: dict[str, Any] = {"model_name": model.__class__.__name__, "data": model}
         if input_summary is not None:
             payload["input_summary"] = input_summary
         return self.dispatch("model", summary, payload)
 
 
+@functools.lru_cache(maxsize=1)
 def get_dispatch_client() -> DispatchClient:
     """Get a dispatch client configured from environment variables.
 
@@ -358,6 +629,10 @@ def get_dispatch_client() -> DispatchClient:
     from environment variables. If required variables are not set, returns
     a no-op client (all dispatch methods return False).
 
+    The environment is read once per process and the same client (and its
+    connection pool) is returned on every call. Call
+    `get_dispatch_client.cache_clear()` to pick up changed variables.
+
     Returns:
         A configured DispatchClient instance.
     """
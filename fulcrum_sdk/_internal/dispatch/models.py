@@ -51,10 +51,13 @@ class DispatchEntry(BaseModel):
     schema_version: int = SCHEMA_VERSION
     client_ts: str | None = None
 
+    model_config = {"frozen": True, "extra": "forbid"}
+
     @field_validator("summary")
     @classmethod
     def summary_single_line(cls, v: str) -> str:
-        if "\n" in v:
+        # Two substring checks beat a compiled [\r\n] regex on short strings
+        if "\n" in v or "\r" in v:
             raise ValueError("summary must be a single line (no newlines)")
         return v
 
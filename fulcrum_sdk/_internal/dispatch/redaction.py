@@ -1,7 +1,12 @@
 """Redaction logic for sensitive data in dispatch payloads."""
 
+import re
+from collections.abc import Iterator
+from json import JSONDecoder
 from typing import Any
 
+from fulcrum_sdk._internal.serialization import dumps
+
 REDACT_KEYS: frozenset[str] = frozenset({
     "api_key",
     "token",
@@ -18,11 +23,59 @@ REDACT_KEYS: frozenset[str] = frozenset({
 
 REDACTED_VALUE = "[REDACTED]"
 
+# Matches any REDACT_KEYS entry followed by a colon in lowercased compact JSON.
+# Scanning `blob.lower()` case-sensitively is several times faster than
+# re.IGNORECASE. str.lower() also folds the Kelvin sign (U+212A) to "k", which
+# bytes.lower() leaves alone, so accept its UTF-8 bytes wherever a "k" appears.
+_SENSITIVE_KEY_PATTERN = re.compile(
+    b'"(?:'
+    + b"|".join(
+        re.escape(key.encode()).replace(b"k", b"(?:k|\xe2\x84\xaa)")
+        for key in sorted(REDACT_KEYS)
+    )
+    + b')":'
+)
+
+# The same match on decoded text, for non-ASCII payloads where byte and
+# character offsets differ; Unicode case folding covers the Kelvin sign.
+_SENSITIVE_KEY_TEXT_PATTERN = re.compile(
+    '"(?:' + "|".join(map(re.escape, sorted(REDACT_KEYS))) + ')":',
+    re.IGNORECASE,
+)
+
+# In compact JSON an object key always follows one of these, and neither can
+# precede an unescaped quote inside a string. Checked per match rather than
+# with a lookbehind, which would slow down the whole scan.
+_KEY_PREFIXES = (b"{", b",", "{", ",")
+
+# Finds where each redacted value ends in the encoded text
+_DECODER = JSONDecoder()
+
+# Matches `<sensitive key> = <value>` assignments in a query string, where the
+# value is a quoted string or a bare token.
+_QUERY_SECRET_PATTERN = re.compile(
+    r"\b(" + "|".join(sorted(REDACT_KEYS)) + r")(\s*=\s*)('(?:[^']|'')*'|\"[^\"]*\"|[^\s,;)]+)",
+    re.IGNORECASE,
+)
+
+
+def redact_query(query: str) -> str:
+    """Redact values assigned to sensitive keys in a query string.
+
+    Args:
+        query: The query text, e.g. a SQL statement.
+
+    Returns:
+        The query with values like `password = 'x'` replaced by "[REDACTED]".
+    """
+    return _QUERY_SECRET_PATTERN.sub(rf"\1\2'{REDACTED_VALUE}'", query)
+
 
 def redact_payload(payload: dict[str, Any], *, skip_redaction: bool = False) -> dict[str, Any]:
-    """Recursively redact sensitive keys from a payload.
+    """Redact sensitive keys from a payload at any depth.
 
-    Creates a deep copy - the original payload is never mutated.
+    Creates a deep copy of the dicts and lists - the original payload is
+    never mutated. Other values are carried over as they are.
 
     Args:
         payload: The dictionary to redact sensitive values from.
@@ -31,33 +84,120 @@ def redact_payload(payload: dict[str, Any], *, skip_redaction: bool = False) ->
     Returns:
         A new dictionary with sensitive values replaced by "[REDACTED]".
     """
-    if skip_redaction:
-        return _deep_copy(payload)
-    return _redact_recursive(payload)
+    return _copy_tree(payload, redact=not skip_redaction)
 
 
-def _redact_recursive(obj: Any) -> Any:
-    """Recursively redact sensitive keys."""
-    if isinstance(obj, dict):
-        result = {}
-        for key, value in obj.items():
-            key_lower = key.lower() if isinstance(key, str) else key
-            if key_lower in REDACT_KEYS:
-                result[key] = REDACTED_VALUE
-            else:
-                result[key] = _redact_recursive(value)
-        return result
-    elif isinstance(obj, list):
-        return [_redact_recursive(item) for item in obj]
+def encode_redacted(payload: dict[str, Any], *, skip_redaction: bool = False) -> bytes:
+    """Redact sensitive keys from a payload and encode it as JSON bytes.
+
+    Equivalent to ``dumps(redact_payload(payload))`` but encodes the payload
+    only once and never copies or walks it: sensitive values are cut out of
+    the encoding directly.
+
+    Args:
+        payload: The dictionary to redact and encode.
+        skip_redaction: If True, encodes the payload as-is.
+
+    Returns:
+        The compact JSON encoding of the redacted payload. A payload the
+        codec can't encode raises TypeError, as it would from ``dumps``.
+    """
+    blob = dumps(payload)
+    if skip_redaction or not _has_sensitive_key(blob):
+        return blob
+    return _redact_encoded(blob)
+
+
+def _key_matches(pattern: re.Pattern[Any], data: Any) -> Iterator[re.Match[Any]]:
+    """Yield the matches of a sensitive key pattern that are object keys."""
+    for match in pattern.finditer(data):
+        start = match.start()
+        if data[start - 1 : start] in _KEY_PREFIXES:
+            yield match
+
+
+def _has_sensitive_key(blob: bytes) -> bool:
+    """Check whether compact JSON has a sensitive key anywhere.
+
+    A plain search rules out most payloads before any match is checked for
+    being an object key.
+    """
+    lowered = blob.lower()
+    if _SENSITIVE_KEY_PATTERN.search(lowered) is None:
+        return False
+    return next(_key_matches(_SENSITIVE_KEY_PATTERN, lowered), None) is not None
+
+
+def _redact_encoded(blob: bytes) -> bytes:
+    """Replace the value of every sensitive key in compact JSON with REDACTED_VALUE.
+
+    Only the matched values are parsed, to find where each one ends; the rest
+    of the encoding is copied through untouched. Sensitive keys nested inside
+    an already redacted value are skipped.
+    """
+    text = blob.decode()
+    if blob.isascii():
+        matches = _key_matches(_SENSITIVE_KEY_PATTERN, blob.lower())
     else:
-        return obj
+        matches = _key_matches(_SENSITIVE_KEY_TEXT_PATTERN, text)
+    parts: list[str] = []
+    pos = 0
+    for match in matches:
+        if match.start() < pos:
+            continue
+        _, pos_after = _DECODER.raw_decode(text, match.end())
+        parts += (text[pos : match.end()], f'"{REDACTED_VALUE}"')
+        pos = pos_after
+    parts.append(text[pos:])
+    return "".join(parts).encode()
+
 
+def _copy_tree(obj: Any, *, redact: bool) -> Any:
+    """Deep-copy dicts and lists, optionally redacting sensitive keys.
 
-def _deep_copy(obj: Any) -> Any:
-    """Create a deep copy of a JSON-serializable object."""
+    Walks the tree with an explicit stack of (source, destination) pairs
+    rather than recursing, so wide or deep payloads don't pay for a Python
+    frame per node. Each container is attached to its parent before its
+    children are filled in, which preserves key order.
+    """
     if isinstance(obj, dict):
-        return {key: _deep_copy(value) for key, value in obj.items()}
+        root: Any = {}
     elif isinstance(obj, list):
-        return [_deep_copy(item) for item in obj]
+        root = []
     else:
         return obj
+
+    stack: list[tuple[Any, Any]] = [(obj, root)]
+    while stack:
+        src, dst = stack.pop()
+        if isinstance(src, dict):
+            for key, value in src.items():
+                # Keys are almost always lowercase already: try the set first and
+                # only pay for .lower() on a miss with uppercase characters.
+                if (
+                    redact
+                    and isinstance(key, str)
+                    and (key in REDACT_KEYS or (not key.islower() and key.lower() in REDACT_KEYS))
+                ):
+                    dst[key] = REDACTED_VALUE
+                    continue
+                if isinstance(value, dict):
+                    dst[key] = child = {}
+                    stack.append((value, child))
+                elif isinstance(value, list):
+                    dst[key] = child = []
+                    stack.append((value, child))
+                else:
+                    dst[key] = value
+        else:
+            for item in src:
+                if isinstance(item, dict):
+                    child = {}
+                    stack.append((item, child))
+                elif isinstance(item, list):
+                    child = []
+                    stack.append((item, child))
+                else:
+                    child = item
+                dst.append(child)
+    return root
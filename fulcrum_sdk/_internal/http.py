@@ -1,29 +1,160 @@
-"""Shared HTTP client configuration."""
+"""Shared HTTP client configuration.
 
-import httpx
+httpx is imported when the first client is created rather than at import
+time, so importing the SDK stays cheap for runs that never send a request.
+"""
+
+import atexit
+import weakref
+from typing import TYPE_CHECKING, Protocol, TypedDict
 
 from fulcrum_sdk._version import __version__
 
+if TYPE_CHECKING:
+    import httpx
+
 DEFAULT_TIMEOUT = 30.0
 DEFAULT_DISPATCH_TIMEOUT = 1.5
 
+# Connect timeout for the runtime clients. A reachable host completes the TCP
+# and TLS handshakes well within this, so waiting the full request timeout
+# for a connection only delays the failure on an unreachable one.
+RUNTIME_CONNECT_TIMEOUT = 0.5
+
+
+class PoolLimits(TypedDict, total=False):
+    """Connection pool limits, as keyword arguments for httpx.Limits."""
+
+    max_connections: int | None
+    max_keepalive_connections: int | None
+    keepalive_expiry: float | None
+
+
+DEFAULT_LIMITS: PoolLimits = {"max_connections": 100, "max_keepalive_connections": 20}
+
+# Dispatch talks to a single host, so a small keep-alive pool is plenty.
+# Capping connections at the keep-alive count means every connection can go
+# back to the pool instead of being closed after a burst. Idle connections are
+# kept for 60s (httpx defaults to 5s) so that dispatches spaced seconds apart
+# still skip the TCP and TLS handshakes; longer risks reusing connections that
+# load balancers have already dropped.
+DISPATCH_LIMITS: PoolLimits = {
+    "max_keepalive_connections": 4,
+    "max_connections": 4,
+    "keepalive_expiry": 60.0,
+}
+
+# HTTP/2 needs the optional h2 package (`pip install fulcrum-sdk[http2]`).
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class _Closeable(Protocol):
+    """Anything with a close() method, e.g. the runtime clients."""
+
+    def close(self) -> None: ...
+
+
+# Clients with an open pool or background worker, closed by one exit hook.
+# Held weakly, so a client the caller drops can still be garbage collected
+# (its sockets are closed when the pool is).
+_open_clients: "weakref.WeakSet[_Closeable]" = weakref.WeakSet()
+
+
+def close_at_exit(client: _Closeable) -> None:
+    """Close `client` at interpreter exit unless it is closed or collected first."""
+    _open_clients.add(client)
+
+
+def cancel_close_at_exit(client: _Closeable) -> None:
+    """Undo `close_at_exit`, e.g. once the client has been closed."""
+    _open_clients.discard(client)
+
+
+@atexit.register
+def _close_open_clients() -> None:
+    """Close every client still open at interpreter exit."""
+    for client in list(_open_clients):
+        client.close()
+
+
+def _timeout(timeout: float, connect_timeout: float | None) -> "float | httpx.Timeout":
+    """Return httpx timeout settings, capping the connect phase if requested."""
+    if connect_timeout is None or connect_timeout >= timeout:
+        return timeout
+    import httpx
+
+    return httpx.Timeout(timeout, connect=connect_timeout)
+
 
 def create_http_client(
     *,
     timeout: float = DEFAULT_TIMEOUT,
     base_url: str | None = None,
-) -> httpx.Client:
+    headers: dict[str, str] | None = None,
+    limits: PoolLimits | None = None,
+    http2: bool = False,
+    transport: "httpx.BaseTransport | None" = None,
+    connect_timeout: float | None = None,
+) -> "httpx.Client":
     """Create configured HTTP client.
 
     Args:
         timeout: Request timeout in seconds.
         base_url: Optional base URL for all requests.
+        headers: Optional headers sent with every request.
+        limits: Optional connection pool limits.
+        http2: Negotiate HTTP/2 when the server supports it. Ignored if h2
+            is not installed.
+        transport: Optional transport to send requests through instead of
+            a connection pool (e.g. httpx.MockTransport in tests).
+        connect_timeout: Optional shorter limit, in seconds, on opening a
+            connection. `timeout` still applies to reads, writes and waiting
+            for a pooled connection.
 
     Returns:
         Configured httpx.Client instance.
     """
+    import httpx
+
     return httpx.Client(
-        timeout=timeout,
+        timeout=_timeout(timeout, connect_timeout),
+        base_url=base_url or "",
+        headers={"User-Agent": f"fulcrum-sdk/{__version__}", **(headers or {})},
+        limits=httpx.Limits(**(limits or DEFAULT_LIMITS)),
+        http2=http2 and HTTP2_AVAILABLE,
+        transport=transport,
+    )
+
+
+def create_async_http_client(
+    *,
+    timeout: float = DEFAULT_TIMEOUT,
+    base_url: str | None = None,
+    headers: dict[str, str] | None = None,
+    limits: PoolLimits | None = None,
+    http2: bool = False,
+    transport: "httpx.AsyncBaseTransport | None" = None,
+    connect_timeout: float | None = None,
+) -> "httpx.AsyncClient":
+    """Create configured async HTTP client.
+
+    Takes the same arguments as `create_http_client`, with an async transport.
+
+    Returns:
+        Configured httpx.AsyncClient instance.
+    """
+    import httpx
+
+    return httpx.AsyncClient(
+        timeout=_timeout(timeout, connect_timeout),
         base_url=base_url or "",
-        headers={"User-Agent": f"fulcrum-sdk/{__version__}"},
+        headers={"User-Agent": f"fulcrum-sdk/{__version__}", **(headers or {})},
+        limits=httpx.Limits(**(limits or DEFAULT_LIMITS)),
+        http2=http2 and HTTP2_AVAILABLE,
+        transport=transport,
     )
@@ -1,23 +1,83 @@
 """Best-effort improvements client for Fulcrum runtime."""
 
-import json
+import asyncio
+import functools
 import os
-from typing import Any
-
-import httpx
-
-from fulcrum_sdk._internal.dispatch.redaction import redact_payload
+import queue
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel, TypeAdapter
+
+from fulcrum_sdk._internal.dispatch.redaction import encode_redacted
+from fulcrum_sdk._internal.http import (
+    RUNTIME_CONNECT_TIMEOUT,
+    PoolLimits,
+    cancel_close_at_exit,
+    close_at_exit,
+    create_async_http_client,
+    create_http_client,
+)
 from fulcrum_sdk._internal.improvements.models import (
+    ACTION_MAX_LENGTH,
+    DEDUPE_KEY_MAX_LENGTH,
+    IMPROVEMENT_STATUSES,
     PAYLOAD_MAX_SIZE_BYTES,
+    TITLE_MAX_LENGTH,
     Improvement,
-    ImprovementCreate,
-    ImprovementEvent,
     ImprovementStatus,
-    ImprovementUpdate,
 )
+from fulcrum_sdk._internal.serialization import dumps
+
+if TYPE_CHECKING:
+    import httpx
 
 DEFAULT_TIMEOUT_MS = 1500
 DEFAULT_MAX_BYTES = PAYLOAD_MAX_SIZE_BYTES
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE = 20
+# Idle connections are kept this long, so bursts spaced seconds apart
+# reuse a warm connection instead of reconnecting (httpx defaults to 5s).
+KEEPALIVE_EXPIRY_S = 60.0
+QUEUE_MAX_SIZE = 1024
+FLUSH_TIMEOUT_S = 2.0
+MAX_BATCH_SIZE = 32
+BATCH_WINDOW_S = 0.05
+# Bound on remembered parsed request URLs; see _parse_url()
+MAX_PARSED_URLS = 256
+
+# Queued by close() to stop the background worker
+_STOP = object()
+
+# Validates a whole list response in one call into pydantic-core; built once
+# so every response reuses the same compiled validator
+_IMPROVEMENT_LIST_ADAPTER = TypeAdapter(list[Improvement])
+
+
+class _ImprovementListResponse(BaseModel):
+    """Object form of a list response; other top-level keys are ignored."""
+
+    improvements: list[Improvement] = []
+
+
+def _discard_debug(message: str, *args: Any) -> None:
+    """Drop a debug message; used as `_log_debug` when debug mode is off."""
+
+
+def _validate_text(name: str, value: Any, max_length: int | None = None) -> None:
+    """Raise ValueError unless value is a string within max_length characters."""
+    if not isinstance(value, str):
+        raise ValueError(f"{name} must be a string")
+    if max_length is not None and len(value) > max_length:
+        raise ValueError(f"{name} must be at most {max_length} characters")
+
+
+def _validate_status(status: Any) -> None:
+    """Raise ValueError unless status is a valid ImprovementStatus."""
+    if status not in IMPROVEMENT_STATUSES:
+        raise ValueError(f"status must be one of {sorted(IMPROVEMENT_STATUSES)}")
 
 
 class ImprovementsClient:
@@ -31,6 +91,39 @@ class ImprovementsClient:
     If required environment variables are missing, a no-op client is returned.
     """
 
+    __slots__ = (
+        "_improvements_url",
+        "_item_url_prefix",
+        "_parsed_urls",
+        "_run_token",
+        "_project_uuid",
+        "_ticket_uuid",
+        "_run_uuid",
+        "_create_prefix",
+        "_create_suffix",
+        "_event_prefix",
+        "_timeout_ms",
+        "_max_bytes",
+        "_debug",
+        "_log_debug",
+        "_enabled",
+        "_headers",
+        "_limits",
+        "_client",
+        "_client_lock",
+        "_async_client",
+        "_transport",
+        "_background",
+        "_events_batch_url",
+        "_queue",
+        "_worker",
+        "_worker_lock",
+        "_list_cache_ttl_s",
+        "_list_cache",
+        # Lets the exit hook hold the client weakly; see close_at_exit()
+        "__weakref__",
+    )
+
     def __init__(
         self,
         *,
@@ -42,6 +135,12 @@ class ImprovementsClient:
         timeout_ms: int = DEFAULT_TIMEOUT_MS,
         max_bytes: int = DEFAULT_MAX_BYTES,
         debug: bool = False,
+        background: bool = False,
+        events_batch_url: str | None = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive: int = DEFAULT_MAX_KEEPALIVE,
+        list_cache_ttl_ms: int = 0,
+        transport: "httpx.BaseTransport | None" = None,
     ) -> None:
         """Initialize the improvements client.
 
@@ -54,16 +153,65 @@ class ImprovementsClient:
             timeout_ms: Request timeout in milliseconds.
             max_bytes: Maximum payload size in bytes.
             debug: Enable debug logging to stderr.
+            background: Send create/update/delete/emit requests from a
+                background thread instead of blocking the caller. Those
+                methods then return True once the request is queued.
+            events_batch_url: Optional batch endpoint for events. In background
+                mode, queued events are coalesced into
+                `{"run_uuid": ..., "events": [...]}` posts to it.
+            max_connections: Maximum open connections per HTTP client.
+            max_keepalive: Maximum idle connections kept open per HTTP client.
+            list_cache_ttl_ms: How long a successful list result is reused for
+                the same project before asking the API again. Any create,
+                update, delete or event request clears the cache. 0 (the
+                default) disables caching.
+            transport: Optional httpx transport for the pooled sync client,
+                e.g. an httpx.MockTransport to capture requests in tests.
         """
         self._improvements_url = improvements_url
+        # Prefix for per-improvement URLs ("<base>/<uuid>", "<base>/<uuid>/events")
+        self._item_url_prefix = (improvements_url or "").rstrip("/") + "/"
+        self._parsed_urls: dict[str, httpx.URL] = {}
         self._run_token = run_token
         self._project_uuid = project_uuid
         self._ticket_uuid = ticket_uuid
         self._run_uuid = run_uuid
+        # The run identifiers never change, so the fields built from them are
+        # encoded once; see _create_body() and _event_body() for field order
+        encoded_run_uuid = b'{"run_uuid":' + dumps(run_uuid)
+        self._create_prefix = encoded_run_uuid + b',"title":'
+        self._create_suffix = b"}"
+        if ticket_uuid:
+            self._create_suffix = b',"ticket_uuid":' + dumps(ticket_uuid) + self._create_suffix
+        if project_uuid:
+            self._create_suffix = b',"project_uuid":' + dumps(project_uuid) + self._create_suffix
+        self._event_prefix = encoded_run_uuid + b',"improvement_uuid":'
         self._timeout_ms = timeout_ms
         self._max_bytes = max_bytes
         self._debug = debug
-        self._enabled = all([improvements_url, run_token, run_uuid])
+        self._log_debug = self._write_debug if debug else _discard_debug
+        self._enabled = bool(improvements_url and run_token and run_uuid)
+        self._headers = {
+            "Authorization": f"Bearer {run_token}",
+            "Content-Type": "application/json",
+        }
+        self._limits: PoolLimits = {
+            "max_connections": max_connections,
+            "max_keepalive_connections": max_keepalive,
+            "keepalive_expiry": KEEPALIVE_EXPIRY_S,
+        }
+        self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
+        self._async_client: httpx.AsyncClient | None = None
+        self._transport = transport
+        self._background = background
+        self._events_batch_url = events_batch_url
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=QUEUE_MAX_SIZE)
+        self._worker: threading.Thread | None = None
+        self._worker_lock = threading.Lock()
+        self._list_cache_ttl_s = list_cache_ttl_ms / 1000
+        # Resolved project UUID -> (expiry on the monotonic clock, improvements)
+        self._list_cache: dict[str | None, tuple[float, tuple[Improvement, ...]]] = {}
 
     @classmethod
     def from_env(cls) -> "ImprovementsClient":
@@ -81,31 +229,39 @@ class ImprovementsClient:
             FULCRUM_IMPROVEMENTS_DEBUG: Set to "1" to enable debug logging.
             FULCRUM_IMPROVEMENTS_TIMEOUT_MS: Request timeout in milliseconds.
             FULCRUM_IMPROVEMENTS_MAX_BYTES: Maximum payload size in bytes.
+            FULCRUM_IMPROVEMENTS_BACKGROUND: Set to "1" to send from a background thread.
+            FULCRUM_IMPROVEMENTS_EVENTS_BATCH_URL: Event batch endpoint used in
+                background mode.
+            FULCRUM_IMPROVEMENTS_MAX_CONNECTIONS: Maximum open connections.
+            FULCRUM_IMPROVEMENTS_MAX_KEEPALIVE: Maximum idle keep-alive connections.
+            FULCRUM_IMPROVEMENTS_LIST_CACHE_TTL_MS: How long list results are reused.
 
         Returns:
             A configured ImprovementsClient. If required env vars are missing,
             returns a no-op client (all methods return False/empty list).
         """
-        improvements_url = os.environ.get("FULCRUM_IMPROVEMENTS_URL")
-
+        env = os.environ
+        improvements_url = env.get("FULCRUM_IMPROVEMENTS_URL")
         # Prefer FULCRUM_RUN_TOKEN, fallback to deprecated FULCRUM_DISPATCH_TOKEN
-        run_token = os.environ.get("FULCRUM_RUN_TOKEN") or os.environ.get(
-            "FULCRUM_DISPATCH_TOKEN"
-        )
-
-        project_uuid = os.environ.get("FULCRUM_PROJECT_UUID")
-        ticket_uuid = os.environ.get("FULCRUM_TICKET_UUID")
-        run_uuid = os.environ.get("FULCRUM_RUN_UUID")
-
-        debug = os.environ.get("FULCRUM_IMPROVEMENTS_DEBUG", "") == "1"
-        timeout_ms = int(
-            os.environ.get("FULCRUM_IMPROVEMENTS_TIMEOUT_MS", str(DEFAULT_TIMEOUT_MS))
-        )
-        max_bytes = int(
-            os.environ.get("FULCRUM_IMPROVEMENTS_MAX_BYTES", str(DEFAULT_MAX_BYTES))
+        run_token = env.get("FULCRUM_RUN_TOKEN") or env.get("FULCRUM_DISPATCH_TOKEN")
+        project_uuid = env.get("FULCRUM_PROJECT_UUID")
+        ticket_uuid = env.get("FULCRUM_TICKET_UUID")
+        run_uuid = env.get("FULCRUM_RUN_UUID")
+
+        debug = env.get("FULCRUM_IMPROVEMENTS_DEBUG") == "1"
+        timeout_ms = int(env.get("FULCRUM_IMPROVEMENTS_TIMEOUT_MS", DEFAULT_TIMEOUT_MS))
+        max_bytes = int(env.get("FULCRUM_IMPROVEMENTS_MAX_BYTES", DEFAULT_MAX_BYTES))
+        background = env.get("FULCRUM_IMPROVEMENTS_BACKGROUND") == "1"
+        events_batch_url = env.get("FULCRUM_IMPROVEMENTS_EVENTS_BATCH_URL")
+        max_connections = int(
+            env.get("FULCRUM_IMPROVEMENTS_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS)
         )
+        max_keepalive = int(env.get("FULCRUM_IMPROVEMENTS_MAX_KEEPALIVE", DEFAULT_MAX_KEEPALIVE))
+        list_cache_ttl_ms = int(env.get("FULCRUM_IMPROVEMENTS_LIST_CACHE_TTL_MS", 0))
 
-        return cls(
+        # Skip the per-call enabled checks entirely when unconfigured
+        client_cls = cls if improvements_url and run_token and run_uuid else _NoopImprovementsClient
+        return client_cls(
             improvements_url=improvements_url,
             run_token=run_token,
             project_uuid=project_uuid,
@@ -114,6 +270,11 @@ class ImprovementsClient:
             timeout_ms=timeout_ms,
             max_bytes=max_bytes,
             debug=debug,
+            background=background,
+            events_batch_url=events_batch_url,
+            max_connections=max_connections,
+            max_keepalive=max_keepalive,
+            list_cache_ttl_ms=list_cache_ttl_ms,
         )
 
     @property
@@ -121,38 +282,416 @@ class ImprovementsClient:
         """Check if the client is properly configured and enabled."""
         return self._enabled
 
-    def _log_debug(self, message: str) -> None:
-        """Log a debug message to stderr if debug mode is enabled."""
-        if self._debug:
-            import sys
+    def close(self) -> None:
+        """Drain queued requests and close the pooled HTTP connection.
 
-            print(f"[fulcrum-sdk:improvements] {message}", file=sys.stderr)
+        Waits at most FLUSH_TIMEOUT_S for the background worker. Safe to call
+        more than once.
+        """
+        cancel_close_at_exit(self)
+        with self._worker_lock:
+            worker, self._worker = self._worker, None
+        if worker is not None:
+            deadline = time.monotonic() + FLUSH_TIMEOUT_S
+            try:
+                self._queue.put(_STOP, timeout=FLUSH_TIMEOUT_S)
+                worker.join(max(0.0, deadline - time.monotonic()))
+            except queue.Full:
+                self._log_debug("Request queue did not drain before close")
+        with self._client_lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    def flush(self, timeout: float = FLUSH_TIMEOUT_S) -> bool:
+        """Wait until requests queued so far have been sent.
 
-    def _get_headers(self) -> dict[str, str]:
-        """Get request headers with authorization."""
-        return {
-            "Authorization": f"Bearer {self._run_token}",
-            "Content-Type": "application/json",
-        }
+        Args:
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            True if the queue drained in time (or nothing was queued), False otherwise.
+        """
+        if self._worker is None:
+            return True
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    async def aclose(self) -> None:
+        """Drain queued requests and close both pooled HTTP connections.
+
+        Like `close()`, but waits for the background worker in a thread so the
+        event loop keeps running meanwhile. Safe to call more than once.
+        """
+        await asyncio.to_thread(self.close)
+        client, self._async_client = self._async_client, None
+        if client is not None:
+            await client.aclose()
+
+    def __enter__(self) -> "ImprovementsClient":
+        """Return the client for use in a with block."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the pooled HTTP connection on leaving a with block."""
+        self.close()
+
+    async def __aenter__(self) -> "ImprovementsClient":
+        """Return the client for use in an async with block."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close both pooled HTTP connections on leaving an async with block."""
+        await self.aclose()
+
+    def _get_client(self) -> "httpx.Client":
+        """Return the pooled HTTP client, creating it on first use.
+
+        The background worker and caller threads can both get here first, so
+        creation is locked to keep a second pool from being built and leaked.
+        """
+        client = self._client
+        if client is None:
+            with self._client_lock:
+                client = self._client
+                if client is None:
+                    self._client = client = create_http_client(
+                        timeout=self._timeout_ms / 1000,
+                        connect_timeout=RUNTIME_CONNECT_TIMEOUT,
+                        headers=self._headers,
+                        limits=self._limits,
+                        http2=True,
+                        transport=self._transport,
+                    )
+                    close_at_exit(self)
+        return client
+
+    def _get_async_client(self) -> "httpx.AsyncClient":
+        """Return the pooled async HTTP client, creating it on first use."""
+        if self._async_client is None:
+            self._async_client = create_async_http_client(
+                timeout=self._timeout_ms / 1000,
+                connect_timeout=RUNTIME_CONNECT_TIMEOUT,
+                headers=self._headers,
+                limits=self._limits,
+                http2=True,
+            )
+        return self._async_client
+
+    def _parse_url(self, url: str) -> "httpx.URL":
+        """Return `url` parsed, reusing the result for repeated URLs.
+
+        httpx parses a string URL on every request, which costs about as much
+        as building the rest of the request. List and create requests always
+        go to the same URL, and events for one improvement share theirs, so
+        parsed URLs are remembered. Once MAX_PARSED_URLS distinct URLs have
+        been seen, the map is reset rather than growing with every improvement.
+        """
+        parsed = self._parsed_urls.get(url)
+        if parsed is None:
+            import httpx
+
+            if len(self._parsed_urls) >= MAX_PARSED_URLS:
+                self._parsed_urls.clear()
+            parsed = self._parsed_urls[url] = httpx.URL(url)
+        return parsed
 
-    def _truncate_payload(self, payload: dict[str, Any]) -> dict[str, Any]:
-        """Truncate payload if it exceeds max bytes."""
-        payload_json = json.dumps(payload, default=str)
-        if len(payload_json.encode("utf-8")) <= self._max_bytes:
+    def _write_debug(self, message: str, *args: Any) -> None:
+        """Log a debug message to stderr.
+
+        Bound as `_log_debug` in debug mode; otherwise `_log_debug` discards
+        messages, so `message` is only %-formatted with `args` when it will
+        be printed.
+        """
+        print(
+            f"[fulcrum-sdk:improvements] {message % args if args else message}",
+            file=sys.stderr,
+        )
+
+    def _truncate_payload(self, payload: bytes) -> bytes:
+        """Replace an encoded payload with a truncation notice if it exceeds max bytes."""
+        if len(payload) <= self._max_bytes:
             return payload
 
         # Payload too large - return a truncation notice
-        return {
+        return dumps({
             "_truncated": True,
-            "_original_size": len(payload_json.encode("utf-8")),
+            "_original_size": len(payload),
             "_max_size": self._max_bytes,
-        }
+        })
+
+    # =========================================================================
+    # Request Building
+    # =========================================================================
+
+    def _list_params(self, project_uuid: str | None) -> dict[str, str]:
+        """Build query parameters for listing improvements."""
+        params: dict[str, str] = {"run_uuid": self._run_uuid}  # type: ignore[dict-item]
+        if project_uuid or self._project_uuid:
+            params["project_uuid"] = project_uuid or self._project_uuid  # type: ignore[assignment]
+        return params
+
+    def _parse_improvements(self, response: "httpx.Response") -> list[Improvement]:
+        """Parse a list response, accepting a bare list or an `improvements` key."""
+        # Validate straight from JSON either way, without building dicts first
+        content = response.content
+        if content.lstrip()[:1] == b"[":
+            return _IMPROVEMENT_LIST_ADAPTER.validate_json(content)
+        envelope = _ImprovementListResponse.model_validate_json(content)
+        if "improvements" not in envelope.model_fields_set:
+            self._log_debug("Unexpected response format: missing 'improvements'")
+        return envelope.improvements
+
+    def _cached_list(self, project_uuid: str | None) -> list[Improvement] | None:
+        """Return a copy of the cached list for a project if it has not expired."""
+        entry = self._list_cache.get(project_uuid or self._project_uuid)
+        if entry is None or time.monotonic() >= entry[0]:
+            return None
+        self._log_debug("Returning cached improvements list")
+        return list(entry[1])
+
+    def _cache_list(self, project_uuid: str | None, improvements: list[Improvement]) -> None:
+        """Remember a successful list result when list caching is enabled."""
+        if self._list_cache_ttl_s > 0:
+            expiry = time.monotonic() + self._list_cache_ttl_s
+            self._list_cache[project_uuid or self._project_uuid] = (expiry, tuple(improvements))
+
+    def _create_body(
+        self,
+        title: str,
+        description: str | None,
+        dedupe_key: str | None,
+        status: ImprovementStatus,
+    ) -> bytes:
+        """Validate and encode a create request.
+
+        Enforces the ImprovementCreate constraints without building the model.
+        """
+        _validate_text("title", title, TITLE_MAX_LENGTH)
+        # Fields in order: run_uuid, title, description, dedupe_key, status,
+        # project_uuid, ticket_uuid; unset optional fields are omitted
+        parts = [self._create_prefix, dumps(title)]
+        if description is not None:
+            _validate_text("description", description)
+            parts += (b',"description":', dumps(description))
+        if dedupe_key is not None:
+            _validate_text("dedupe_key", dedupe_key, DEDUPE_KEY_MAX_LENGTH)
+            parts += (b',"dedupe_key":', dumps(dedupe_key))
+        _validate_status(status)
+        parts += (b',"status":', dumps(status), self._create_suffix)
+        return b"".join(parts)
+
+    def _update_body(self, fields: dict[str, Any]) -> bytes | None:
+        """Validate and encode an update request, or None if no field is updatable.
+
+        Enforces the ImprovementUpdate constraints without building the model.
+        """
+        request_body: dict[str, Any] = {"run_uuid": self._run_uuid}
+        title = fields.get("title")
+        if title is not None:
+            _validate_text("title", title, TITLE_MAX_LENGTH)
+            request_body["title"] = title
+        description = fields.get("description")
+        if description is not None:
+            _validate_text("description", description)
+            request_body["description"] = description
+        status = fields.get("status")
+        if status is not None:
+            _validate_status(status)
+            request_body["status"] = status
+
+        if len(request_body) == 1:
+            self._log_debug("No valid fields to update")
+            return None
+        return dumps(request_body)
+
+    def _event_body(
+        self,
+        improvement_uuid: str,
+        action: str,
+        payload: dict[str, Any] | None,
+    ) -> bytes:
+        """Validate, redact, truncate and encode an event request.
+
+        Enforces the ImprovementEvent constraints without building the model.
+        """
+        _validate_text("improvement_uuid", improvement_uuid)
+        _validate_text("action", action, ACTION_MAX_LENGTH)
+        parts = [self._event_prefix, dumps(improvement_uuid), b',"action":', dumps(action)]
+        if payload is not None:
+            # Redact, encode and truncate the payload in one pass, then splice
+            # it in as the last field, so the whole body is joined once
+            parts += (b',"payload":', self._truncate_payload(encode_redacted(payload)))
+        parts.append(b"}")
+        return b"".join(parts)
+
+    # =========================================================================
+    # Sending
+    # =========================================================================
+
+    def _request(
+        self, label: str, method: str, url: str, **kwargs: Any
+    ) -> "httpx.Response | None":
+        """Send a request on the pooled client.
+
+        Args:
+            label: Operation name used in debug messages (e.g. "Create").
+            method: HTTP method.
+            url: Request URL.
+            **kwargs: Passed through to `httpx.Client.request`.
+
+        Returns:
+            The response if it has a 2xx status, None on any error.
+        """
+        import httpx
+
+        try:
+            client = self._get_client()
+            response = client.request(method, self._parse_url(url), **kwargs)
+        except httpx.TimeoutException:
+            self._log_debug("%s request timed out", label)
+            return None
+        except Exception as e:
+            self._log_debug("%s error: %s", label, e)
+            return None
+        finally:
+            if method != "GET":
+                # Even a failed mutation may have changed what list returns
+                self._list_cache.clear()
+        return self._check_status(label, response)
+
+    async def _arequest(
+        self, label: str, method: str, url: str, **kwargs: Any
+    ) -> "httpx.Response | None":
+        """Send a request on the pooled async client.
+
+        Same contract as `_request`.
+        """
+        import httpx
+
+        try:
+            client = self._get_async_client()
+            response = await client.request(method, self._parse_url(url), **kwargs)
+        except httpx.TimeoutException:
+            self._log_debug("%s request timed out", label)
+            return None
+        except Exception as e:
+            self._log_debug("%s error: %s", label, e)
+            return None
+        finally:
+            if method != "GET":
+                self._list_cache.clear()
+        return self._check_status(label, response)
+
+    def _send(self, label: str, method: str, url: str, **kwargs: Any) -> bool:
+        """Send a mutating request now, or queue it in background mode.
+
+        Returns:
+            True if the request succeeded (or was queued), False otherwise.
+        """
+        if self._background:
+            return self._enqueue((label, method, url, kwargs))
+        if self._request(label, method, url, **kwargs) is None:
+            return False
+        self._log_debug("%s succeeded", label)
+        return True
+
+    def _enqueue(self, item: tuple[str, str, str, dict[str, Any]]) -> bool:
+        """Queue a request for the background worker."""
+        if self._worker is None:
+            self._start_worker()
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self._log_debug("Request queue full, dropping request")
+            return False
+        return True
+
+    def _start_worker(self) -> None:
+        """Start the background worker thread if it is not running."""
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._drain_loop, name="fulcrum-improvements", daemon=True
+                )
+                self._worker.start()
+                close_at_exit(self)
+
+    def _drain_loop(self) -> None:
+        """Send queued requests until the stop sentinel is received."""
+        item = None
+        while True:
+            if item is None:
+                item = self._queue.get()
+            if item is _STOP:
+                return
+            if isinstance(item, threading.Event):
+                item.set()
+                item = None
+                continue
+            label, method, url, kwargs = item
+            if label != "Event" or self._events_batch_url is None:
+                if self._request(label, method, url, **kwargs) is not None:
+                    self._log_debug("%s succeeded", label)
+                item = None
+                continue
+
+            batch = [kwargs["content"]]
+            item = self._collect_events(batch)
+            self._send_events(batch)
+
+    def _collect_events(self, batch: list[bytes]) -> Any:
+        """Fill an event batch until MAX_BATCH_SIZE events or BATCH_WINDOW_S elapses.
+
+        Returns:
+            The queued item that cut the batch short (a control marker or a
+            non-event request), if any, so the caller can handle it next.
+        """
+        deadline = time.monotonic() + BATCH_WINDOW_S
+        while len(batch) < MAX_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _STOP or isinstance(item, threading.Event) or item[0] != "Event":
+                return item
+            batch.append(item[3]["content"])
+        return None
+
+    def _send_events(self, bodies: list[bytes]) -> None:
+        """Send several encoded events to the batch endpoint in one request."""
+        self._log_debug("Sending batch of %d events", len(bodies))
+        body = b'{"run_uuid":%b,"events":[%b]}' % (dumps(self._run_uuid), b",".join(bodies))
+        url = self._events_batch_url
+        if self._request("Event batch", "POST", url, content=body) is not None:  # type: ignore[arg-type]
+            self._log_debug("Event batch succeeded")
+
+    def _check_status(self, label: str, response: "httpx.Response") -> "httpx.Response | None":
+        """Return the response if it succeeded, logging and returning None otherwise."""
+        if response.is_success:
+            return response
+        self._log_debug("%s failed with status %d", label, response.status_code)
+        return None
+
+    # =========================================================================
+    # Operations
+    # =========================================================================
 
     def list_improvements(
         self, project_uuid: str | None = None
     ) -> list[Improvement]:
         """List improvements for the current run or project.
 
+        When the client has a list_cache_ttl_ms, a result fetched within that
+        time for the same project is returned without a request.
+
         Args:
             project_uuid: Optional project UUID to filter by. If not provided,
                          uses the project_uuid from env vars.
@@ -163,40 +702,24 @@ class ImprovementsClient:
         if not self._enabled:
             self._log_debug("Client not enabled, returning empty list")
             return []
-
-        try:
-            params: dict[str, str] = {"run_uuid": self._run_uuid}  # type: ignore[dict-item]
-            if project_uuid or self._project_uuid:
-                params["project_uuid"] = project_uuid or self._project_uuid  # type: ignore[assignment]
-
-            with httpx.Client(timeout=self._timeout_ms / 1000) as client:
-                response = client.get(
-                    self._improvements_url,  # type: ignore[arg-type]
-                    params=params,
-                    headers=self._get_headers(),
-                )
-                if response.status_code >= 200 and response.status_code < 300:
-                    data = response.json()
-                    if isinstance(data, list):
-                        improvements_data = data
-                    elif isinstance(data, dict):
-                        improvements_data = data.get("improvements", data)
-                    else:
-                        self._log_debug(f"Unexpected response format: {type(data)}")
-                        return []
-
-                    if isinstance(improvements_data, list):
-                        return [Improvement(**item) for item in improvements_data]
-                    self._log_debug(f"Unexpected response format: {type(improvements_data)}")
-                    return []
-                else:
-                    self._log_debug(f"List failed with status {response.status_code}")
-                    return []
-        except httpx.TimeoutException:
-            self._log_debug("List request timed out")
+        cached = self._cached_list(project_uuid)
+        if cached is not None:
+            return cached
+
+        response = self._request(
+            "List",
+            "GET",
+            self._improvements_url,  # type: ignore[arg-type]
+            params=self._list_params(project_uuid),
+        )
+        if response is None:
             return []
+        try:
+            improvements = self._parse_improvements(response)
+            self._cache_list(project_uuid, improvements)
+            return improvements
         except Exception as e:
-            self._log_debug(f"List error: {e}")
+            self._log_debug("List error: %s", e)
             return []
 
     def create_improvement(
@@ -215,50 +738,23 @@ class ImprovementsClient:
             status: Initial status (default: 'open').
 
         Returns:
-            True if the improvement was created successfully, False otherwise.
+            True if the improvement was created successfully (or queued, in
+            background mode), False otherwise.
         """
         if not self._enabled:
             self._log_debug("Client not enabled, skipping create")
             return False
 
         try:
-            payload = ImprovementCreate(
-                title=title,
-                description=description,
-                dedupe_key=dedupe_key,
-                status=status,
-            )
-
-            request_body: dict[str, Any] = {
-                "run_uuid": self._run_uuid,
-                **payload.model_dump(mode="json", exclude_none=True),
-            }
-            if self._project_uuid:
-                request_body["project_uuid"] = self._project_uuid
-            if self._ticket_uuid:
-                request_body["ticket_uuid"] = self._ticket_uuid
-
-            self._log_debug(f"Creating improvement: {title[:50]}")
-
-            with httpx.Client(timeout=self._timeout_ms / 1000) as client:
-                response = client.post(
-                    self._improvements_url,  # type: ignore[arg-type]
-                    json=request_body,
-                    headers=self._get_headers(),
-                )
-                if response.status_code >= 200 and response.status_code < 300:
-                    self._log_debug("Create succeeded")
-                    return True
-                else:
-                    self._log_debug(f"Create failed with status {response.status_code}")
-                    return False
-        except httpx.TimeoutException:
-            self._log_debug("Create request timed out")
-            return False
+            body = self._create_body(title, description, dedupe_key, status)
         except Exception as e:
-            self._log_debug(f"Create error: {e}")
+            self._log_debug("Create error: %s", e)
             return False
 
+        self._log_debug("Creating improvement: %.50s", title)
+        url = self._improvements_url
+        return self._send("Create", "POST", url, content=body)  # type: ignore[arg-type]
+
     def update_improvement(
         self,
         uuid: str,
@@ -271,51 +767,24 @@ class ImprovementsClient:
             **fields: Fields to update (title, description, status).
 
         Returns:
-            True if the improvement was updated successfully, False otherwise.
+            True if the improvement was updated successfully (or queued, in
+            background mode), False otherwise.
         """
         if not self._enabled:
             self._log_debug("Client not enabled, skipping update")
             return False
 
         try:
-            # Filter to valid fields
-            valid_fields = {
-                k: v
-                for k, v in fields.items()
-                if k in ("title", "description", "status") and v is not None
-            }
-
-            if not valid_fields:
-                self._log_debug("No valid fields to update")
-                return False
-
-            payload = ImprovementUpdate(**valid_fields)
-            request_body: dict[str, Any] = {
-                "run_uuid": self._run_uuid,
-                **payload.model_dump(mode="json", exclude_none=True),
-            }
-
-            url = f"{self._improvements_url}/{uuid}"
-            self._log_debug(f"Updating improvement: {uuid}")
-
-            with httpx.Client(timeout=self._timeout_ms / 1000) as client:
-                response = client.patch(
-                    url,
-                    json=request_body,
-                    headers=self._get_headers(),
-                )
-                if response.status_code >= 200 and response.status_code < 300:
-                    self._log_debug("Update succeeded")
-                    return True
-                else:
-                    self._log_debug(f"Update failed with status {response.status_code}")
-                    return False
-        except httpx.TimeoutException:
-            self._log_debug("Update request timed out")
-            return False
+            body = self._update_body(fields)
         except Exception as e:
-            self._log_debug(f"Update error: {e}")
+            self._log_debug("Update error: %s", e)
             return False
+        if body is None:
+            return False
+
+        self._log_debug("Updating improvement: %s", uuid)
+        url = f"{self._item_url_prefix}{uuid}"
+        return self._send("Update", "PATCH", url, content=body)
 
     def delete_improvement(self, uuid: str) -> bool:
         """Delete an improvement.
@@ -324,36 +793,17 @@ class ImprovementsClient:
             uuid: The UUID of the improvement to delete.
 
         Returns:
-            True if the improvement was deleted successfully, False otherwise.
+            True if the improvement was deleted successfully (or queued, in
+            background mode), False otherwise.
         """
         if not self._enabled:
             self._log_debug("Client not enabled, skipping delete")
             return False
 
-        try:
-            url = f"{self._improvements_url}/{uuid}"
-            params = {"run_uuid": self._run_uuid}
-
-            self._log_debug(f"Deleting improvement: {uuid}")
-
-            with httpx.Client(timeout=self._timeout_ms / 1000) as client:
-                response = client.delete(
-                    url,
-                    params=params,
-                    headers=self._get_headers(),
-                )
-                if response.status_code >= 200 and response.status_code < 300:
-                    self._log_debug("Delete succeeded")
-                    return True
-                else:
-                    self._log_debug(f"Delete failed with status {response.status_code}")
-                    return False
-        except httpx.TimeoutException:
-            self._log_debug("Delete request timed out")
-            return False
-        except Exception as e:
-            self._log_debug(f"Delete error: {e}")
-            return False
+        self._log_debug("Deleting improvement: %s", uuid)
+        url = f"{self._item_url_prefix}{uuid}"
+        params = {"run_uuid": self._run_uuid}
+        return self._send("Delete", "DELETE", url, params=params)
 
     def emit_improvement_event(
         self,
@@ -369,53 +819,180 @@ class ImprovementsClient:
             payload: Optional additional data for the event.
 
         Returns:
-            True if the event was emitted successfully, False otherwise.
+            True if the event was emitted successfully (or queued, in
+            background mode), False otherwise.
         """
         if not self._enabled:
             self._log_debug("Client not enabled, skipping event")
             return False
 
         try:
-            # Redact and truncate payload if provided
-            processed_payload: dict[str, Any] | None = None
-            if payload is not None:
-                processed_payload = redact_payload(payload)
-                processed_payload = self._truncate_payload(processed_payload)
-
-            event = ImprovementEvent(
-                improvement_uuid=improvement_uuid,
-                action=action,
-                payload=processed_payload,
-            )
+            body = self._event_body(improvement_uuid, action, payload)
+        except Exception as e:
+            self._log_debug("Event error: %s", e)
+            return False
 
-            request_body: dict[str, Any] = {
-                "run_uuid": self._run_uuid,
-                **event.model_dump(mode="json", exclude_none=True),
-            }
+        self._log_debug("Emitting event: %s for %s", action, improvement_uuid)
+        url = f"{self._item_url_prefix}{improvement_uuid}/events"
+        return self._send("Event", "POST", url, content=body)
 
-            url = f"{self._improvements_url}/{improvement_uuid}/events"
-            self._log_debug(f"Emitting event: {action} for {improvement_uuid}")
+    # =========================================================================
+    # Async Operations
+    # =========================================================================
 
-            with httpx.Client(timeout=self._timeout_ms / 1000) as client:
-                response = client.post(
-                    url,
-                    json=request_body,
-                    headers=self._get_headers(),
-                )
-                if response.status_code >= 200 and response.status_code < 300:
-                    self._log_debug("Event emitted successfully")
-                    return True
-                else:
-                    self._log_debug(f"Event failed with status {response.status_code}")
-                    return False
-        except httpx.TimeoutException:
-            self._log_debug("Event request timed out")
+    async def alist_improvements(
+        self, project_uuid: str | None = None
+    ) -> list[Improvement]:
+        """Async variant of `list_improvements`."""
+        if not self._enabled:
+            self._log_debug("Client not enabled, returning empty list")
+            return []
+        cached = self._cached_list(project_uuid)
+        if cached is not None:
+            return cached
+
+        response = await self._arequest(
+            "List",
+            "GET",
+            self._improvements_url,  # type: ignore[arg-type]
+            params=self._list_params(project_uuid),
+        )
+        if response is None:
+            return []
+        try:
+            improvements = self._parse_improvements(response)
+            self._cache_list(project_uuid, improvements)
+            return improvements
+        except Exception as e:
+            self._log_debug("List error: %s", e)
+            return []
+
+    async def acreate_improvement(
+        self,
+        title: str,
+        description: str | None = None,
+        dedupe_key: str | None = None,
+        status: ImprovementStatus = "open",
+    ) -> bool:
+        """Async variant of `create_improvement`."""
+        if not self._enabled:
+            self._log_debug("Client not enabled, skipping create")
             return False
+
+        try:
+            body = self._create_body(title, description, dedupe_key, status)
         except Exception as e:
-            self._log_debug(f"Event error: {e}")
+            self._log_debug("Create error: %s", e)
             return False
 
+        self._log_debug("Creating improvement: %.50s", title)
+        url = self._improvements_url
+        if await self._arequest("Create", "POST", url, content=body) is None:  # type: ignore[arg-type]
+            return False
+        self._log_debug("Create succeeded")
+        return True
 
+    async def aupdate_improvement(self, uuid: str, **fields: Any) -> bool:
+        """Async variant of `update_improvement`."""
+        if not self._enabled:
+            self._log_debug("Client not enabled, skipping update")
+            return False
+
+        try:
+            body = self._update_body(fields)
+        except Exception as e:
+            self._log_debug("Update error: %s", e)
+            return False
+        if body is None:
+            return False
+
+        self._log_debug("Updating improvement: %s", uuid)
+        url = f"{self._item_url_prefix}{uuid}"
+        if await self._arequest("Update", "PATCH", url, content=body) is None:
+            return False
+        self._log_debug("Update succeeded")
+        return True
+
+    async def adelete_improvement(self, uuid: str) -> bool:
+        """Async variant of `delete_improvement`."""
+        if not self._enabled:
+            self._log_debug("Client not enabled, skipping delete")
+            return False
+
+        self._log_debug("Deleting improvement: %s", uuid)
+        url = f"{self._item_url_prefix}{uuid}"
+        params = {"run_uuid": self._run_uuid}
+        if await self._arequest("Delete", "DELETE", url, params=params) is None:
+            return False
+        self._log_debug("Delete succeeded")
+        return True
+
+    async def aemit_improvement_event(
+        self,
+        improvement_uuid: str,
+        action: str,
+        payload: dict[str, Any] | None = None,
+    ) -> bool:
+        """Async variant of `emit_improvement_event`."""
+        if not self._enabled:
+            self._log_debug("Client not enabled, skipping event")
+            return False
+
+        try:
+            body = self._event_body(improvement_uuid, action, payload)
+        except Exception as e:
+            self._log_debug("Event error: %s", e)
+            return False
+
+        self._log_debug("Emitting event: %s for %s", action, improvement_uuid)
+        url = f"{self._item_url_prefix}{improvement_uuid}/events"
+        if await self._arequest("Event", "POST", url, content=body) is None:
+            return False
+        self._log_debug("Event emitted successfully")
+        return True
+
+
+class _NoopImprovementsClient(ImprovementsClient):
+    """Improvements client returned by `from_env` when required config is missing.
+
+    Every operation returns its failure value straight away, without the
+    enabled check, validation or debug logging the full client performs.
+    """
+
+    __slots__ = ()
+
+    def list_improvements(self, *args: Any, **kwargs: Any) -> list[Improvement]:
+        return []
+
+    def create_improvement(self, *args: Any, **kwargs: Any) -> bool:
+        return False
+
+    def update_improvement(self, *args: Any, **kwargs: Any) -> bool:
+        return False
+
+    def delete_improvement(self, *args: Any, **kwargs: Any) -> bool:
+        return False
+
+    def emit_improvement_event(self, *args: Any, **kwargs: Any) -> bool:
+        return False
+
+    async def alist_improvements(self, *args: Any, **kwargs: Any) -> list[Improvement]:
+        return []
+
+    async def acreate_improvement(self, *args: Any, **kwargs: Any) -> bool:
+        return False
+
+    async def aupdate_improvement(self, *args: Any, **kwargs: Any) -> bool:
+        return False
+
+    async def adelete_improvement(self, *args: Any, **kwargs: Any) -> bool:
+        return False
+
+    async def aemit_improvement_event(self, *args: Any, **kwargs: Any) -> bool:
+        return False
+
+
+@functools.lru_cache(maxsize=1)
 def get_improvements_client() -> ImprovementsClient:
     """Get an improvements client configured from environment variables.
 
@@ -423,6 +1000,10 @@ def get_improvements_client() -> ImprovementsClient:
     from environment variables. If required variables are not set, returns
     a no-op client (all methods return False/empty list).
 
+    The environment is read once per process and the same client (and its
+    connection pool) is returned on every call. Call
+    `get_improvements_client.cache_clear()` to pick up changed variables.
+
     Returns:
         A configured ImprovementsClient instance.
     """
@@ -3,7 +3,7 @@
 These models define the structure for improvements data.
 """
 
-from typing import Any, Literal
+from typing import Any, Literal, get_args
 
 from pydantic import BaseModel, Field
 
@@ -12,10 +12,14 @@ from pydantic import BaseModel, Field
 # =============================================================================
 
 PAYLOAD_MAX_SIZE_BYTES = 64 * 1024  # 64KB
+TITLE_MAX_LENGTH = 256
+DEDUPE_KEY_MAX_LENGTH = 256
+ACTION_MAX_LENGTH = 64
 SCHEMA_VERSION = 1
 
 # Valid improvement statuses
 ImprovementStatus = Literal["open", "in_progress", "resolved", "dismissed"]
+IMPROVEMENT_STATUSES: frozenset[str] = frozenset(get_args(ImprovementStatus))
 
 # =============================================================================
 # Response Models
@@ -39,6 +43,8 @@ class Improvement(BaseModel):
     created_at: str | None = None
     updated_at: str | None = None
 
+    model_config = {"frozen": True}
+
 
 # =============================================================================
 # Request Models
@@ -57,9 +63,9 @@ class ImprovementCreate(BaseModel):
         status: Initial status (default: 'open')
     """
 
-    title: str = Field(max_length=256)
+    title: str = Field(max_length=TITLE_MAX_LENGTH)
     description: str | None = None
-    dedupe_key: str | None = Field(default=None, max_length=256)
+    dedupe_key: str | None = Field(default=None, max_length=DEDUPE_KEY_MAX_LENGTH)
     status: ImprovementStatus = "open"
 
 
@@ -69,7 +75,7 @@ class ImprovementUpdate(BaseModel):
     All fields are optional - only provided fields are updated.
     """
 
-    title: str | None = Field(default=None, max_length=256)
+    title: str | None = Field(default=None, max_length=TITLE_MAX_LENGTH)
     description: str | None = None
     status: ImprovementStatus | None = None
 
@@ -86,7 +92,7 @@ class ImprovementEvent(BaseModel):
     """
 
     improvement_uuid: str
-    action: str = Field(max_length=64)
+    action: str = Field(max_length=ACTION_MAX_LENGTH)
     payload: dict[str, Any] | None = None
 
     model_config = {"extra": "allow"}
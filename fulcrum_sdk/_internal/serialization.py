@@ -0,0 +1,98 @@
+"""JSON encoding shared by the internal clients.
+
+Uses orjson when it is installed (``pip install fulcrum-sdk[fast]``) and
+falls back to pydantic-core's serializer otherwise. Both run in native code
+and emit compact UTF-8.
+
+Besides JSON-native types, both backends encode datetimes and UUIDs as ISO
+strings, Decimals and paths as strings, sets as lists, UTF-8 bytes as strings,
+integers of any size, NaN and infinities as null, and enums, dataclasses and
+Pydantic models by value.
+Anything else raises TypeError rather than being silently stringified.
+"""
+
+from collections.abc import Callable
+from decimal import Decimal
+from pathlib import PurePath
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic_core import PydanticSerializationError, from_json, to_json
+
+
+def _default(obj: Any) -> Any:
+    """Encode the types the backend doesn't handle natively."""
+    if isinstance(obj, Decimal | PurePath):
+        return str(obj)
+    if isinstance(obj, set | frozenset):
+        return list(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _pydantic_dumps(obj: Any) -> bytes:
+    """Serialize an object to compact JSON bytes with pydantic-core."""
+    try:
+        # NaN and infinities aren't valid JSON; send null as orjson does
+        return to_json(obj, fallback=_default, inf_nan_mode="null")
+    except PydanticSerializationError as e:
+        raise TypeError(str(e)) from e
+
+
+# orjson is an optional extra (`pip install fulcrum-sdk[fast]`).
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+dumps: Callable[[Any], bytes]
+loads: Callable[[bytes | str], Any]
+
+if ORJSON_AVAILABLE:
+
+    def _orjson_default(obj: Any) -> Any:
+        """Splice models in via their own cached serializer, then fall back."""
+        if isinstance(obj, BaseModel):
+            return orjson.Fragment(obj.model_dump_json())
+        return _default(obj)
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize an object to compact JSON bytes."""
+        try:
+            return orjson.dumps(obj, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson rejects ints beyond 64 bits and bytes, which pydantic-core
+            # encodes; retrying there keeps both backends accepting the same
+            # values, and only costs anything for payloads that would fail
+            return _pydantic_dumps(obj)
+
+    def loads(data: bytes | str) -> Any:
+        """Parse JSON bytes or text into Python objects."""
+        return orjson.loads(data)
+
+else:
+    dumps = _pydantic_dumps
+
+    def loads(data: bytes | str) -> Any:
+        """Parse JSON bytes or text into Python objects."""
+        return from_json(data)
+
+
+def append_field(obj: bytes, key: str, value: bytes) -> bytes:
+    """Append an already-encoded field to an encoded, non-empty JSON object.
+
+    Lets a large encoded value (e.g. a payload) be embedded without decoding
+    or re-encoding it, copying its bytes once.
+
+    Args:
+        obj: Compact JSON encoding of an object with at least one field.
+        key: The field name to append.
+        value: The JSON encoding of the field value.
+
+    Returns:
+        The encoded object with the field added last.
+    """
+    return b"".join((obj[:-1], b",", dumps(key), b":", value, b"}"))
@@ -1,21 +1,37 @@
 """Public exceptions for the Fulcrum SDK."""
 
+from typing import Any
+
 
 class FulcrumError(Exception):
     """Base exception for all Fulcrum SDK errors."""
 
+    __slots__ = ()
+
 
 class FulcrumAPIError(FulcrumError):
     """Error from Fulcrum API."""
 
+    # Keeps status_code out of the lazily created instance __dict__
+    __slots__ = ("status_code",)
+
     def __init__(self, message: str, status_code: int | None = None) -> None:
         super().__init__(message)
         self.status_code = status_code
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Exception pickling only carries args and __dict__, not slots, so pass
+        # status_code as an argument and keep __dict__ (e.g. __notes__) as state
+        return type(self), (*self.args, self.status_code), getattr(self, "__dict__", None)
+
 
 class FulcrumConfigError(FulcrumError):
     """Configuration error (missing env vars, invalid config)."""
 
+    __slots__ = ()
+
 
 class FulcrumValidationError(FulcrumError):
     """Validation error for request/response data."""
+
+    __slots__ = ()
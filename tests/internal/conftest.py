@@ -0,0 +1,83 @@
+"""Shared fixtures for internal client tests."""
+
+import os
+
+import httpx
+import pytest
+
+from fulcrum_sdk._internal.dispatch import get_dispatch_client
+from fulcrum_sdk._internal.improvements import get_improvements_client
+
+
+class RecordingTransport(httpx.MockTransport):
+    """In-memory transport that records requests and answers with canned responses.
+
+    Register responses per method and URL with `respond()`; the query string
+    is ignored when matching. Anything else gets `status_code`, or raises
+    `error` instead if it is set (e.g. httpx.TimeoutException).
+    """
+
+    def __init__(self) -> None:
+        super().__init__(self._handle)
+        self.requests: list[httpx.Request] = []
+        self.status_code = 200
+        self.error: Exception | None = None
+        self._responses: dict[tuple[str, str], list[httpx.Response | Exception]] = {}
+
+    def respond(self, method: str, url: str, *responses: httpx.Response | Exception) -> None:
+        """Answer `method url` with `responses` in turn, repeating the last one.
+
+        An exception is raised from the request instead of being returned.
+        """
+        self._responses[(method, url)] = list(responses)
+
+    def sent(self, method: str) -> list[httpx.Request]:
+        """Return the recorded requests with the given method."""
+        return [request for request in self.requests if request.method == method]
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        url = str(request.url.copy_with(query=None))
+        responses = self._responses.get((request.method, url))
+        if not responses:
+            if self.error is not None:
+                raise self.error
+            return httpx.Response(self.status_code)
+        response = responses.pop(0) if len(responses) > 1 else responses[0]
+        if isinstance(response, Exception):
+            raise response
+        # Copy so a canned response can be answered more than once
+        return httpx.Response(
+            response.status_code, headers=response.headers, content=response.content
+        )
+
+
+@pytest.fixture(autouse=True)
+def clear_client_caches():
+    """Reset the memoized clients so each test reads its own environment."""
+    get_dispatch_client.cache_clear()
+    get_improvements_client.cache_clear()
+    yield
+    get_dispatch_client.cache_clear()
+    get_improvements_client.cache_clear()
+
+
+@pytest.fixture
+def set_env(monkeypatch):
+    """Return a function that replaces the process environment for the test.
+
+    The clients read `os.environ` on each `from_env()` call, so swapping in a
+    plain dict isolates a test from the real environment without copying and
+    restoring it; monkeypatch puts the original back afterwards.
+    """
+
+    def _set_env(values: dict[str, str]) -> None:
+        monkeypatch.setattr(os, "environ", dict(values))
+
+    return _set_env
+
+
+@pytest.fixture
+def transport():
+    """Return a recording transport to pass to a client."""
+    return RecordingTransport()
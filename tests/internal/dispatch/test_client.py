@@ -1,20 +1,28 @@
 """Tests for DispatchClient."""
 
-import os
+import gc
+import json
+import threading
+import time
+import weakref
+from datetime import UTC, datetime
 from unittest.mock import patch
 
 import httpx
 import pytest
-import respx
 from pydantic import BaseModel
 
+from fulcrum_sdk._internal import http as http_module
+from fulcrum_sdk._internal.dispatch import client as client_module
 from fulcrum_sdk._internal.dispatch.client import DispatchClient, get_dispatch_client
+from fulcrum_sdk._internal.dispatch.models import SCHEMA_VERSION, DispatchEntry
+from fulcrum_sdk._internal.http import DISPATCH_LIMITS
 
 
 class TestDispatchClientFromEnv:
     """Tests for DispatchClient.from_env()."""
 
-    def test_from_env_with_all_vars(self):
+    def test_from_env_with_all_vars(self, set_env):
         """Should create enabled client when all vars are set."""
         env = {
             "FULCRUM_DISPATCH_URL": "http://localhost:3000/api/dispatch",
@@ -23,44 +31,44 @@ class TestDispatchClientFromEnv:
             "FULCRUM_RUN_UUID": "run-456",
             "FULCRUM_MESSAGE_UUID": "msg-789",
         }
-        with patch.dict(os.environ, env, clear=True):
-            client = DispatchClient.from_env()
-            assert client.enabled is True
+        set_env(env)
+        client = DispatchClient.from_env()
+        assert client.enabled is True
 
-    def test_from_env_missing_url(self):
+    def test_from_env_missing_url(self, set_env):
         """Should create disabled client when URL is missing."""
         env = {
             "FULCRUM_DISPATCH_TOKEN": "test-token",
             "FULCRUM_TICKET_UUID": "ticket-123",
             "FULCRUM_RUN_UUID": "run-456",
         }
-        with patch.dict(os.environ, env, clear=True):
-            client = DispatchClient.from_env()
-            assert client.enabled is False
+        set_env(env)
+        client = DispatchClient.from_env()
+        assert client.enabled is False
 
-    def test_from_env_missing_token(self):
+    def test_from_env_missing_token(self, set_env):
         """Should create disabled client when token is missing."""
         env = {
             "FULCRUM_DISPATCH_URL": "http://localhost:3000/api/dispatch",
             "FULCRUM_TICKET_UUID": "ticket-123",
             "FULCRUM_RUN_UUID": "run-456",
         }
-        with patch.dict(os.environ, env, clear=True):
-            client = DispatchClient.from_env()
-            assert client.enabled is False
+        set_env(env)
+        client = DispatchClient.from_env()
+        assert client.enabled is False
 
-    def test_from_env_missing_ticket_uuid(self):
+    def test_from_env_missing_ticket_uuid(self, set_env):
         """Should create disabled client when ticket_uuid is missing."""
         env = {
             "FULCRUM_DISPATCH_URL": "http://localhost:3000/api/dispatch",
             "FULCRUM_DISPATCH_TOKEN": "test-token",
             "FULCRUM_RUN_UUID": "run-456",
         }
-        with patch.dict(os.environ, env, clear=True):
-            client = DispatchClient.from_env()
-            assert client.enabled is False
+        set_env(env)
+        client = DispatchClient.from_env()
+        assert client.enabled is False
 
-    def test_from_env_with_optional_settings(self):
+    def test_from_env_with_optional_settings(self, set_env):
         """Should parse optional settings from env."""
         env = {
             "FULCRUM_DISPATCH_URL": "http://localhost:3000/api/dispatch",
@@ -71,13 +79,26 @@ class TestDispatchClientFromEnv:
             "FULCRUM_DISPATCH_TIMEOUT_MS": "3000",
             "FULCRUM_DISPATCH_MAX_BYTES": "32768",
         }
-        with patch.dict(os.environ, env, clear=True):
-            client = DispatchClient.from_env()
-            assert client._debug is True
-            assert client._timeout_ms == 3000
-            assert client._max_bytes == 32768
+        set_env(env)
+        client = DispatchClient.from_env()
+        assert client._debug is True
+        assert client._timeout_ms == 3000
+        assert client._max_bytes == 32768
+
+    def test_from_env_reads_current_environment(self, set_env):
+        """Should pick up variables set after an earlier call."""
+        set_env({})
+        assert DispatchClient.from_env().enabled is False
+        env = {
+            "FULCRUM_DISPATCH_URL": "http://test/dispatch",
+            "FULCRUM_RUN_TOKEN": "token",
+            "FULCRUM_TICKET_UUID": "ticket",
+            "FULCRUM_RUN_UUID": "run",
+        }
+        set_env(env)
+        assert DispatchClient.from_env().enabled is True
 
-    def test_from_env_malformed_timeout_ms_raises(self):
+    def test_from_env_malformed_timeout_ms_raises(self, set_env):
         """Should raise ValueError when FULCRUM_DISPATCH_TIMEOUT_MS is not a valid integer."""
         env = {
             "FULCRUM_DISPATCH_URL": "http://localhost:3000/api/dispatch",
@@ -86,10 +107,11 @@ class TestDispatchClientFromEnv:
             "FULCRUM_RUN_UUID": "run-456",
             "FULCRUM_DISPATCH_TIMEOUT_MS": "not_a_number",
         }
-        with patch.dict(os.environ, env, clear=True), pytest.raises(ValueError):
+        set_env(env)
+        with pytest.raises(ValueError):
             DispatchClient.from_env()
 
-    def test_from_env_malformed_max_bytes_raises(self):
+    def test_from_env_malformed_max_bytes_raises(self, set_env):
         """Should raise ValueError when FULCRUM_DISPATCH_MAX_BYTES is not a valid integer."""
         env = {
             "FULCRUM_DISPATCH_URL": "http://localhost:3000/api/dispatch",
@@ -98,10 +120,11 @@ class TestDispatchClientFromEnv:
             "FULCRUM_RUN_UUID": "run-456",
             "FULCRUM_DISPATCH_MAX_BYTES": "invalid",
         }
-        with patch.dict(os.environ, env, clear=True), pytest.raises(ValueError):
+        set_env(env)
+        with pytest.raises(ValueError):
             DispatchClient.from_env()
 
-    def test_from_env_prefers_run_token(self):
+    def test_from_env_prefers_run_token(self, set_env):
         """Should prefer FULCRUM_RUN_TOKEN over FULCRUM_DISPATCH_TOKEN."""
         env = {
             "FULCRUM_DISPATCH_URL": "http://localhost:3000/api/dispatch",
@@ -110,12 +133,12 @@ class TestDispatchClientFromEnv:
             "FULCRUM_TICKET_UUID": "ticket-123",
             "FULCRUM_RUN_UUID": "run-456",
         }
-        with patch.dict(os.environ, env, clear=True):
-            client = DispatchClient.from_env()
-            assert client.enabled is True
-            assert client._dispatch_token == "preferred-token"
+        set_env(env)
+        client = DispatchClient.from_env()
+        assert client.enabled is True
+        assert client._dispatch_token == "preferred-token"
 
-    def test_from_env_fallback_to_dispatch_token(self):
+    def test_from_env_fallback_to_dispatch_token(self, set_env):
         """Should fallback to FULCRUM_DISPATCH_TOKEN when RUN_TOKEN is missing."""
         env = {
             "FULCRUM_DISPATCH_URL": "http://localhost:3000/api/dispatch",
@@ -123,10 +146,10 @@ class TestDispatchClientFromEnv:
             "FULCRUM_TICKET_UUID": "ticket-123",
             "FULCRUM_RUN_UUID": "run-456",
         }
-        with patch.dict(os.environ, env, clear=True):
-            client = DispatchClient.from_env()
-            assert client.enabled is True
-            assert client._dispatch_token == "fallback-token"
+        set_env(env)
+        client = DispatchClient.from_env()
+        assert client.enabled is True
+        assert client._dispatch_token == "fallback-token"
 
 
 class TestDispatchClientNoOp:
@@ -138,6 +161,13 @@ class TestDispatchClientNoOp:
         assert client.enabled is False
         assert client.dispatch("text", "Test") is False
 
+    def test_client_uses_slots(self):
+        """Should keep all state in slots rather than an instance dict."""
+        client = DispatchClient()
+        assert not hasattr(client, "__dict__")
+        with pytest.raises(AttributeError):
+            client.unexpected = True  # type: ignore[attr-defined]
+
     def test_noop_dispatch_text_returns_false(self):
         """No-op client should return False for dispatch_text."""
         client = DispatchClient()
@@ -162,41 +192,36 @@ class TestDispatchClientNoOp:
 class TestDispatchClientSend:
     """Tests for DispatchClient sending behavior."""
 
-    @respx.mock
-    def test_dispatch_success(self):
+    def test_dispatch_success(self, transport):
         """Should return True on successful dispatch."""
-        route = respx.post("http://test/dispatch").mock(
-            return_value=httpx.Response(200, json={"uuid": "abc"})
-        )
-
         client = DispatchClient(
             dispatch_url="http://test/dispatch",
             dispatch_token="token",
             ticket_uuid="ticket",
             run_uuid="run",
+            transport=transport,
         )
         result = client.dispatch("text", "Test message")
         assert result is True
-        assert route.called
+        assert transport.requests
 
-    @respx.mock
-    def test_dispatch_server_error(self):
+    def test_dispatch_server_error(self, transport):
         """Should return False on server error."""
-        respx.post("http://test/dispatch").mock(return_value=httpx.Response(500))
+        transport.status_code = 500
 
         client = DispatchClient(
             dispatch_url="http://test/dispatch",
             dispatch_token="token",
             ticket_uuid="ticket",
             run_uuid="run",
+            transport=transport,
         )
         result = client.dispatch("text", "Test")
         assert result is False
 
-    @respx.mock
-    def test_dispatch_timeout(self):
+    def test_dispatch_timeout(self, transport):
         """Should return False on timeout."""
-        respx.post("http://test/dispatch").mock(side_effect=httpx.TimeoutException("timeout"))
+        transport.error = httpx.TimeoutException("timeout")
 
         client = DispatchClient(
             dispatch_url="http://test/dispatch",
@@ -204,135 +229,560 @@ class TestDispatchClientSend:
             ticket_uuid="ticket",
             run_uuid="run",
             timeout_ms=100,
+            transport=transport,
         )
         result = client.dispatch("text", "Test")
         assert result is False
 
-    @respx.mock
-    def test_dispatch_network_error(self):
+    def test_dispatch_network_error(self, transport):
         """Should return False on network error."""
-        respx.post("http://test/dispatch").mock(
-            side_effect=httpx.ConnectError("connection failed")
-        )
+        transport.error = httpx.ConnectError("connection failed")
 
         client = DispatchClient(
             dispatch_url="http://test/dispatch",
             dispatch_token="token",
             ticket_uuid="ticket",
             run_uuid="run",
+            transport=transport,
         )
         result = client.dispatch("text", "Test")
         assert result is False
 
-    @respx.mock
-    def test_dispatch_sends_correct_payload(self):
+    def test_dispatch_sends_correct_payload(self, transport):
         """Should send correctly structured payload."""
-        route = respx.post("http://test/dispatch").mock(return_value=httpx.Response(200))
-
         client = DispatchClient(
             dispatch_url="http://test/dispatch",
             dispatch_token="token",
             ticket_uuid="ticket-123",
             run_uuid="run-456",
             message_uuid="msg-789",
+            transport=transport,
         )
         client.dispatch("api_call", "Called API", {"service": "test"})
 
-        request = route.calls.last.request
-        body = request.content.decode()
-        assert "ticket-123" in body
-        assert "run-456" in body
-        assert "msg-789" in body
-        assert "api_call" in body
-        assert "Called API" in body
+        request = transport.requests[-1]
+        body = request.content
+        assert b"ticket-123" in body
+        assert b"run-456" in body
+        assert b"msg-789" in body
+        assert b"api_call" in body
+        assert b"Called API" in body
 
-    @respx.mock
-    def test_dispatch_sends_auth_header(self):
-        """Should send authorization header."""
-        route = respx.post("http://test/dispatch").mock(return_value=httpx.Response(200))
+    def test_dispatch_sends_compact_json(self, transport):
+        """Should post compact JSON with a JSON content type."""
+        client = DispatchClient(
+            dispatch_url="http://test/dispatch",
+            dispatch_token="token",
+            ticket_uuid="ticket",
+            run_uuid="run",
+            transport=transport,
+        )
+        client.dispatch("json", "Test", {"items": [1, 2]})
 
+        request = transport.requests[-1]
+        assert request.headers["content-type"] == "application/json"
+        assert b'"kind":"json"' in request.content
+        assert request.content.endswith(b'"payload":{"items":[1,2]}}')
+
+    def test_dispatch_sends_auth_header(self, transport):
+        """Should send authorization header."""
         client = DispatchClient(
             dispatch_url="http://test/dispatch",
             dispatch_token="secret-token",
             ticket_uuid="ticket",
             run_uuid="run",
+            transport=transport,
         )
         client.dispatch("text", "Test")
 
-        request = route.calls.last.request
+        request = transport.requests[-1]
         assert request.headers["authorization"] == "Bearer secret-token"
 
-    @respx.mock
-    def test_dispatch_redacts_payload(self):
-        """Should redact sensitive keys in payload."""
-        route = respx.post("http://test/dispatch").mock(return_value=httpx.Response(200))
+    def test_headers_are_set_once_on_pooled_client(self):
+        """Should bake the auth and content-type headers into the pooled client."""
+        client = DispatchClient(
+            dispatch_url="http://test/dispatch",
+            dispatch_token="secret-token",
+            ticket_uuid="ticket",
+            run_uuid="run",
+        )
+        with client:
+            headers = client._get_client().headers
+            assert headers["authorization"] == "Bearer secret-token"
+            assert headers["content-type"] == "application/json"
 
+    def test_dispatch_redacts_payload(self, transport):
+        """Should redact sensitive keys in payload."""
         client = DispatchClient(
             dispatch_url="http://test/dispatch",
             dispatch_token="token",
             ticket_uuid="ticket",
             run_uuid="run",
+            transport=transport,
         )
         client.dispatch("json", "Test", {"api_key": "secret123", "data": "visible"})
 
-        request = route.calls.last.request
-        body = request.content.decode()
-        assert "secret123" not in body
-        assert "[REDACTED]" in body
-        assert "visible" in body
+        request = transport.requests[-1]
+        body = request.content
+        assert b"secret123" not in body
+        assert b"[REDACTED]" in body
+        assert b"visible" in body
 
-    @respx.mock
-    def test_dispatch_truncates_long_summary(self):
+    def test_dispatch_truncates_long_summary(self, transport):
         """Should truncate summary exceeding max length."""
-        route = respx.post("http://test/dispatch").mock(return_value=httpx.Response(200))
-
         client = DispatchClient(
             dispatch_url="http://test/dispatch",
             dispatch_token="token",
             ticket_uuid="ticket",
             run_uuid="run",
+            transport=transport,
         )
         long_summary = "x" * 600
         result = client.dispatch("text", long_summary)
 
         assert result is True
-        request = route.calls.last.request
-        body = request.content.decode()
+        request = transport.requests[-1]
+        body = request.content
         # Should be truncated to 512 chars with ...
-        assert "..." in body
+        assert b"..." in body
+
+    def test_dispatch_truncates_large_payload(self, transport):
+        """Should replace payloads over max_bytes with a truncation notice."""
+        client = DispatchClient(
+            dispatch_url="http://test/dispatch",
+            dispatch_token="token",
+            ticket_uuid="ticket",
+            run_uuid="run",
+            max_bytes=100,
+            transport=transport,
+        )
+        result = client.dispatch("json", "Big", {"data": "é" * 60})
+
+        assert result is True
+        body = json.loads(transport.requests[-1].content)
+        # 60 two-byte characters plus the JSON framing
+        assert body["payload"] == {"_truncated": True, "_original_size": 131, "_max_size": 100}
+
+    def test_dispatch_keeps_payload_at_max_bytes(self, transport):
+        """Should send payloads exactly at max_bytes unchanged."""
+        payload = {"data": "x" * 40}
+        client = DispatchClient(
+            dispatch_url="http://test/dispatch",
+            dispatch_token="token",
+            ticket_uuid="ticket",
+            run_uuid="run",
+            max_bytes=len(b'{"data":""}') + 40,
+            transport=transport,
+        )
+        client.dispatch("json", "Exact", payload)
+
+        assert json.loads(transport.requests[-1].content)["payload"] == payload
+
+    def test_dispatch_flattens_line_breaks_in_summary(self, transport):
+        """Should replace both newlines and carriage returns with spaces."""
+        client = DispatchClient(
+            dispatch_url="http://test/dispatch",
+            dispatch_token="token",
+            ticket_uuid="ticket",
+            run_uuid="run",
+            transport=transport,
+        )
+        client.dispatch("text", "Line 1\r\nLine 2\nLine 3")
+
+        body = json.loads(transport.requests[-1].content)
+        assert body["summary"] == "Line 1  Line 2 Line 3"
+
+    def test_debug_logs_to_stderr(self, transport, capsys):
+        """Should log to stderr only when debug mode is enabled."""
+        kwargs = {
+            "transport": transport,
+            "dispatch_url": "http://test/dispatch",
+            "dispatch_token": "token",
+            "ticket_uuid": "ticket",
+            "run_uuid": "run",
+        }
+        DispatchClient(**kwargs).dispatch("text", "Quiet")
+        assert capsys.readouterr().err == ""
+
+        DispatchClient(**kwargs, debug=True).dispatch("text", "Loud")
+        assert "[fulcrum-sdk] Sending dispatch: text - Loud" in capsys.readouterr().err
+
+    def test_dispatch_body_matches_entry_schema(self, transport):
+        """Should send a body that validates as a DispatchEntry."""
+        client = DispatchClient(
+            dispatch_url="http://test/dispatch",
+            dispatch_token="token",
+            ticket_uuid="ticket-123",
+            run_uuid="run-456",
+            transport=transport,
+        )
+        client.dispatch("json", "Line 1\nLine 2", {"data": "visible"}, client_ts="2024-01-01")
+
+        entry = DispatchEntry.model_validate_json(transport.requests[-1].content)
+        assert entry.summary == "Line 1 Line 2"
+        assert entry.payload == {"data": "visible"}
+        assert entry.client_ts == "2024-01-01"
+        assert entry.message_uuid is None
+
+    def test_dispatch_body_fields_in_entry_order_with_payload_last(self, transport):
+        """Should encode every field, escaped, in DispatchEntry order but with payload last."""
+        client = DispatchClient(
+            dispatch_url="http://test/dispatch",
+            dispatch_token="token",
+            ticket_uuid='ticket-"1"',
+            run_uuid="run",
+            message_uuid="msg",
+            transport=transport,
+        )
+        client.dispatch("text", 'Say "hi"', {"n": 1}, source="agent", client_ts="2024-01-01")
+
+        expected = {
+            "ticket_uuid": 'ticket-"1"',
+            "run_uuid": "run",
+            "kind": "text",
+            "summary": 'Say "hi"',
+            "message_uuid": "msg",
+            "source": "agent",
+            "schema_version": SCHEMA_VERSION,
+            "client_ts": "2024-01-01",
+            "payload": {"n": 1},
+        }
+        content = transport.requests[-1].content
+        assert content == json.dumps(expected, separators=(",", ":")).encode()
+
+    def test_dispatch_defaults_client_ts_to_now(self, transport):
+        """Should stamp entries with the current UTC time when client_ts is omitted."""
+        client = DispatchClient(
+            dispatch_url="http://test/dispatch",
+            dispatch_token="token",
+            ticket_uuid="ticket",
+            run_uuid="run",
+            transport=transport,
+        )
+        before = datetime.now(UTC)
+        client.dispatch("text", "First")
+        client.dispatch("text", "Second")
+        after = datetime.now(UTC)
+
+        stamps = [
+            datetime.fromisoformat(json.loads(request.content)["client_ts"])
+            for request in transport.requests
+        ]
+        assert before <= stamps[0] <= stamps[1] <= after
+
+    def test_dispatch_invalid_kind_returns_false(self, transport):
+        """Should reject kinds that violate the DispatchEntry contract."""
+        client = DispatchClient(
+            dispatch_url="http://test/dispatch",
+            dispatch_token="token",
+            ticket_uuid="ticket",
+            run_uuid="run",
+            transport=transport,
+        )
+        assert client.dispatch("", "Test") is False
+        assert client.dispatch("x" * 65, "Test") is False
+        assert not transport.requests
+
+    def test_dispatch_reuses_http_client(self, transport):
+        """Should reuse one pooled HTTP client across dispatches."""
+        client = DispatchClient(
+            dispatch_url="http://test/dispatch",
+            dispatch_token="token",
+            ticket_uuid="ticket",
+            run_uuid="run",
+            transport=transport,
+        )
+        client.dispatch("text", "First")
+        http_client = client._client
+        client.dispatch("text", "Second")
+
+        assert http_client is not None
+        assert client._client is http_client
+        assert len(transport.requests) == 2
+        assert all(request.headers.get("connection") != "close" for request in transport.requests)
+
+    def test_concurrent_first_use_creates_one_client(self, transport):
+        """Should build a single pooled client when threads race to first use it."""
+        created = []
+        create_http_client = client_module.create_http_client
+
+        def slow_create(**kwargs):
+            time.sleep(0.01)
+            created.append(create_http_client(**kwargs))
+            return created[-1]
+
+        client = DispatchClient(
+            dispatch_url="http://test/dispatch",
+            dispatch_token="token",
+            ticket_uuid="ticket",
+            run_uuid="run",
+            transport=transport,
+        )
+        barrier = threading.Barrier(8)
+        results = []
+
+        def first_use():
+            barrier.wait()
+            results.append(client._get_client())
+
+        with patch.object(client_module, "create_http_client", slow_create):
+            threads = [threading.Thread(target=first_use) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert len(created) == 1
+        assert all(result is created[0] for result in results)
+        client.close()
+
+    def test_applies_keepalive_limits(self):
+        """Should keep idle connections for the configured keep-alive expiry."""
+        client = DispatchClient(
+            dispatch_url="http://test/dispatch",
+            dispatch_token="token",
+            ticket_uuid="ticket",
+            run_uuid="run",
+        )
+        with client:
+            pool = client._get_client()._transport._pool
+            assert pool._keepalive_expiry == DISPATCH_LIMITS["keepalive_expiry"]
+            assert pool._max_keepalive_connections == DISPATCH_LIMITS["max_keepalive_connections"]
+            # Every connection the pool opens can be kept alive
+            assert pool._max_connections == pool._max_keepalive_connections
+        assert client._client is None
+
+    def test_caps_connect_timeout(self, transport):
+        """Should fail fast on connecting while reads get the full timeout_ms."""
+        client = DispatchClient(
+            dispatch_url="http://test/dispatch",
+            dispatch_token="token",
+            ticket_uuid="ticket",
+            run_uuid="run",
+            transport=transport,
+        )
+        with client:
+            assert client._get_client().timeout == httpx.Timeout(1.5, connect=0.5)
+
+    def test_close_releases_http_client(self, transport):
+        """Should close the pooled client and rebuild it on next dispatch."""
+        client = DispatchClient(
+            dispatch_url="http://test/dispatch",
+            dispatch_token="token",
+            ticket_uuid="ticket",
+            run_uuid="run",
+            transport=transport,
+        )
+        client.dispatch("text", "Test")
+        http_client = client._client
+        client.close()
+
+        assert http_client is not None
+        assert http_client.is_closed
+        assert client._client is None
+        assert client.dispatch("text", "Again") is True
+
+    def test_open_client_closed_at_exit_until_closed(self, transport):
+        """Should register an open client with the exit hook, and drop it on close."""
+        client = DispatchClient(
+            dispatch_url="http://test/dispatch",
+            dispatch_token="token",
+            ticket_uuid="ticket",
+            run_uuid="run",
+            transport=transport,
+        )
+        client.dispatch("text", "Test")
+        assert client in http_module._open_clients
+
+        client.close()
+        assert client not in http_module._open_clients
+
+    def test_unreferenced_client_is_collected(self, transport):
+        """Should not keep a dropped client and its pool alive until exit."""
+        client = DispatchClient(
+            dispatch_url="http://test/dispatch",
+            dispatch_token="token",
+            ticket_uuid="ticket",
+            run_uuid="run",
+            transport=transport,
+        )
+        client.dispatch("text", "Test")
+        ref = weakref.ref(client)
+
+        del client
+        gc.collect()
+
+        assert ref() is None
+
+
+class TestDispatchClientBackground:
+    """Tests for background (queued) sending."""
+
+    def test_background_dispatch_sends_on_flush(self, transport):
+        """Should queue entries and send them from the worker thread."""
+        client = DispatchClient(
+            dispatch_url="http://test/dispatch",
+            dispatch_token="token",
+            ticket_uuid="ticket",
+            run_uuid="run",
+            background=True,
+            transport=transport,
+        )
+        assert client.dispatch("text", "First") is True
+        assert client.dispatch("text", "Second") is True
+        assert client.flush() is True
+
+        assert len(transport.requests) == 2
+        client.close()
+
+    def test_background_close_drains_queue(self, transport):
+        """Should send queued entries before closing."""
+        client = DispatchClient(
+            dispatch_url="http://test/dispatch",
+            dispatch_token="token",
+            ticket_uuid="ticket",
+            run_uuid="run",
+            background=True,
+            transport=transport,
+        )
+        client.dispatch("text", "Test")
+        client.close()
+
+        assert len(transport.requests) == 1
+        assert client._worker is None
+
+    def test_background_server_error_still_queued(self, transport):
+        """Should report queued entries as accepted even if the send fails."""
+        transport.status_code = 500
+
+        client = DispatchClient(
+            dispatch_url="http://test/dispatch",
+            dispatch_token="token",
+            ticket_uuid="ticket",
+            run_uuid="run",
+            background=True,
+            transport=transport,
+        )
+        assert client.dispatch("text", "Test") is True
+        client.close()
+
+    def test_background_snapshots_payload(self, transport):
+        """Should send the payload as it was at dispatch time."""
+        client = DispatchClient(
+            dispatch_url="http://test/dispatch",
+            dispatch_token="token",
+            ticket_uuid="ticket",
+            run_uuid="run",
+            background=True,
+            transport=transport,
+        )
+        payload = {"status": "before"}
+        client.dispatch("json", "Test", payload)
+        payload["status"] = "after"
+        client.close()
+
+        assert b'"status":"before"' in transport.requests[-1].content
+
+    def test_background_batches_entries(self, transport):
+        """Should coalesce queued entries into one batch request."""
+        client = DispatchClient(
+            dispatch_url="http://test/dispatch",
+            dispatch_token="token",
+            ticket_uuid="ticket",
+            run_uuid="run",
+            background=True,
+            batch_url="http://test/dispatch/batch",
+            transport=transport,
+        )
+        for i in range(3):
+            client.dispatch("text", f"Entry {i}")
+        client.close()
+
+        assert [request.url.path for request in transport.requests] == ["/dispatch/batch"]
+        body = json.loads(transport.requests[-1].content)
+        assert [entry["summary"] for entry in body["entries"]] == ["Entry 0", "Entry 1", "Entry 2"]
+
+    def test_background_batches_burst_within_size_limit(self, transport):
+        """Should send a burst of entries in batches of at most MAX_BATCH_SIZE."""
+        client = DispatchClient(
+            dispatch_url="http://test/dispatch",
+            dispatch_token="token",
+            ticket_uuid="ticket",
+            run_uuid="run",
+            background=True,
+            batch_url="http://test/dispatch/batch",
+            transport=transport,
+        )
+        count = client_module.MAX_BATCH_SIZE * 2 + 1
+        for i in range(count):
+            assert client.dispatch("text", f"Entry {i}") is True
+        client.close()
+
+        batches = [json.loads(request.content)["entries"] for request in transport.requests]
+        assert len(batches) < count
+        assert all(len(batch) <= client_module.MAX_BATCH_SIZE for batch in batches)
+        summaries = [entry["summary"] for batch in batches for entry in batch]
+        assert summaries == [f"Entry {i}" for i in range(count)]
+
+    def test_background_queue_full_returns_false(self):
+        """Should drop entries when the queue is full."""
+        with (
+            patch.object(client_module, "QUEUE_MAX_SIZE", 1),
+            patch.object(DispatchClient, "_start_worker"),
+        ):
+            client = DispatchClient(
+                dispatch_url="http://test/dispatch",
+                dispatch_token="token",
+                ticket_uuid="ticket",
+                run_uuid="run",
+                background=True,
+            )
+            assert client.dispatch("text", "First") is True
+            assert client.dispatch("text", "Second") is False
+
+    def test_from_env_background(self, set_env):
+        """Should enable background mode from env."""
+        env = {
+            "FULCRUM_DISPATCH_URL": "http://test/dispatch",
+            "FULCRUM_DISPATCH_TOKEN": "token",
+            "FULCRUM_TICKET_UUID": "ticket",
+            "FULCRUM_RUN_UUID": "run",
+            "FULCRUM_DISPATCH_BACKGROUND": "1",
+            "FULCRUM_DISPATCH_BATCH_URL": "http://test/dispatch/batch",
+        }
+        set_env(env)
+        client = DispatchClient.from_env()
+        assert client._background is True
+        assert client._batch_url == "http://test/dispatch/batch"
 
 
 class TestConvenienceMethods:
     """Tests for convenience dispatch methods."""
 
-    @respx.mock
-    def test_dispatch_text(self):
+    def test_dispatch_text(self, transport):
         """Should dispatch text event."""
-        route = respx.post("http://test/dispatch").mock(return_value=httpx.Response(200))
-
         client = DispatchClient(
             dispatch_url="http://test/dispatch",
             dispatch_token="token",
             ticket_uuid="ticket",
             run_uuid="run",
+            transport=transport,
         )
         result = client.dispatch_text("Message sent", "Additional details")
 
         assert result is True
-        body = route.calls.last.request.content.decode()
-        assert '"kind":"text"' in body
-        assert "Additional details" in body
+        body = transport.requests[-1].content
+        assert b'"kind":"text"' in body
+        assert b"Additional details" in body
 
-    @respx.mock
-    def test_dispatch_api_call(self):
+    def test_dispatch_api_call(self, transport):
         """Should dispatch API call event."""
-        route = respx.post("http://test/dispatch").mock(return_value=httpx.Response(200))
-
         client = DispatchClient(
             dispatch_url="http://test/dispatch",
             dispatch_token="token",
             ticket_uuid="ticket",
             run_uuid="run",
+            transport=transport,
         )
         result = client.dispatch_api_call(
             "Sent SMS",
@@ -342,36 +792,47 @@ class TestConvenienceMethods:
         )
 
         assert result is True
-        body = route.calls.last.request.content.decode()
-        assert '"kind":"api_call"' in body
-        assert "twilio" in body
-        assert "send_sms" in body
-        assert "+1234567890" in body
-
-    @respx.mock
-    def test_dispatch_db(self):
-        """Should dispatch DB event."""
-        route = respx.post("http://test/dispatch").mock(return_value=httpx.Response(200))
+        body = transport.requests[-1].content
+        assert b'"kind":"api_call"' in body
+        assert b"twilio" in body
+        assert b"send_sms" in body
+        assert b"+1234567890" in body
 
+    def test_dispatch_db(self, transport):
+        """Should dispatch DB event."""
         client = DispatchClient(
             dispatch_url="http://test/dispatch",
             dispatch_token="token",
             ticket_uuid="ticket",
             run_uuid="run",
+            transport=transport,
         )
         result = client.dispatch_db("Inserted users", "insert", "users", rows=5)
 
         assert result is True
-        body = route.calls.last.request.content.decode()
-        assert '"kind":"db"' in body
-        assert '"table":"users"' in body
-        assert '"count":5' in body
+        body = transport.requests[-1].content
+        assert b'"kind":"db"' in body
+        assert b'"table":"users"' in body
+        assert b'"count":5' in body
 
-    @respx.mock
-    def test_dispatch_model(self):
-        """Should dispatch model event with data."""
-        route = respx.post("http://test/dispatch").mock(return_value=httpx.Response(200))
+    def test_dispatch_db_redacts_query_secrets(self, transport):
+        """Should redact sensitive values assigned in the query text."""
+        client = DispatchClient(
+            dispatch_url="http://test/dispatch",
+            dispatch_token="token",
+            ticket_uuid="ticket",
+            run_uuid="run",
+            transport=transport,
+        )
+        client.dispatch_db(
+            "Updated user", "update", "users", query="UPDATE users SET password = 'hunter2'"
+        )
+
+        body = json.loads(transport.requests[-1].content)
+        assert body["payload"]["query"] == "UPDATE users SET password = '[REDACTED]'"
 
+    def test_dispatch_model(self, transport):
+        """Should dispatch model event with data."""
         class UserProfile(BaseModel):
             name: str
             email: str
@@ -381,30 +842,48 @@ class TestConvenienceMethods:
             dispatch_token="token",
             ticket_uuid="ticket",
             run_uuid="run",
+            transport=transport,
         )
         model = UserProfile(name="Test", email="test@example.com")
         result = client.dispatch_model("Validated user", model, input_summary="Raw user data")
 
         assert result is True
-        body = route.calls.last.request.content.decode()
-        assert '"kind":"model"' in body
-        assert "UserProfile" in body
-        assert "Raw user data" in body
+        body = transport.requests[-1].content
+        assert b'"kind":"model"' in body
+        assert b"UserProfile" in body
+        assert b"Raw user data" in body
         # Verify data field contains serialized model values
-        assert '"data":' in body
-        assert '"name":"Test"' in body
-        assert '"email":"test@example.com"' in body
+        assert b'"data":' in body
+        assert b'"name":"Test"' in body
+        assert b'"email":"test@example.com"' in body
 
-    @respx.mock
-    def test_dispatch_external_ref(self):
-        """Should dispatch external ref event."""
-        route = respx.post("http://test/dispatch").mock(return_value=httpx.Response(200))
+    def test_dispatch_model_redacts_fields(self, transport):
+        """Should redact sensitive fields of the dispatched model."""
+
+        class Connection(BaseModel):
+            host: str
+            password: str
+
+        client = DispatchClient(
+            dispatch_url="http://test/dispatch",
+            dispatch_token="token",
+            ticket_uuid="ticket",
+            run_uuid="run",
+            transport=transport,
+        )
+        client.dispatch_model("Connected", Connection(host="db", password="hunter2"))
+
+        body = json.loads(transport.requests[-1].content)
+        assert body["payload"]["data"] == {"host": "db", "password": "[REDACTED]"}
 
+    def test_dispatch_external_ref(self, transport):
+        """Should dispatch external ref event."""
         client = DispatchClient(
             dispatch_url="http://test/dispatch",
             dispatch_token="token",
             ticket_uuid="ticket",
             run_uuid="run",
+            transport=transport,
         )
         result = client.dispatch_external_ref(
             "Browser task started",
@@ -415,22 +894,22 @@ class TestConvenienceMethods:
         )
 
         assert result is True
-        body = route.calls.last.request.content.decode()
-        assert '"kind":"external_ref"' in body
-        assert "browser-use" in body
-        assert "task-123" in body
+        body = transport.requests[-1].content
+        assert b'"kind":"external_ref"' in body
+        assert b"browser-use" in body
+        assert b"task-123" in body
 
 
 class TestGetDispatchClient:
     """Tests for get_dispatch_client helper function."""
 
-    def test_returns_client(self):
+    def test_returns_client(self, set_env):
         """Should return a DispatchClient instance."""
-        with patch.dict(os.environ, {}, clear=True):
-            client = get_dispatch_client()
-            assert isinstance(client, DispatchClient)
+        set_env({})
+        client = get_dispatch_client()
+        assert isinstance(client, DispatchClient)
 
-    def test_uses_from_env(self):
+    def test_uses_from_env(self, set_env):
         """Should configure from environment."""
         env = {
             "FULCRUM_DISPATCH_URL": "http://test/dispatch",
@@ -438,6 +917,15 @@ class TestGetDispatchClient:
             "FULCRUM_TICKET_UUID": "ticket",
             "FULCRUM_RUN_UUID": "run",
         }
-        with patch.dict(os.environ, env, clear=True):
-            client = get_dispatch_client()
-            assert client.enabled is True
+        set_env(env)
+        client = get_dispatch_client()
+        assert client.enabled is True
+
+    def test_returns_cached_client(self, set_env):
+        """Should read the environment once and reuse the client."""
+        set_env({})
+        client = get_dispatch_client()
+        set_env({"FULCRUM_DISPATCH_URL": "http://test/dispatch"})
+        assert get_dispatch_client() is client
+        get_dispatch_client.cache_clear()
+        assert get_dispatch_client() is not client
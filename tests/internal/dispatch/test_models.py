@@ -76,6 +76,16 @@ class TestDispatchEntry:
             )
         assert "single line" in str(exc_info.value)
 
+    def test_summary_no_carriage_returns(self):
+        """Should reject summary with a bare carriage return, as the client strips both."""
+        with pytest.raises(ValidationError, match="single line"):
+            DispatchEntry(
+                ticket_uuid="ticket-123",
+                run_uuid="run-456",
+                kind="text",
+                summary="Line 1\rLine 2",
+            )
+
     def test_kind_max_length(self):
         """Should reject kind exceeding max length."""
         long_kind = "x" * (KIND_MAX_LENGTH + 1)
@@ -112,6 +122,29 @@ class TestDispatchEntry:
         assert "payload" not in data
         assert "client_ts" not in data
 
+    def test_entry_is_frozen(self):
+        """Should reject attribute assignment after construction."""
+        entry = DispatchEntry(
+            ticket_uuid="ticket-123",
+            run_uuid="run-456",
+            kind="text",
+            summary="Test",
+        )
+        with pytest.raises(ValidationError):
+            entry.summary = "Changed"
+
+    def test_extra_fields_forbidden(self):
+        """Should reject fields outside the dispatch contract."""
+        with pytest.raises(ValidationError) as exc_info:
+            DispatchEntry(
+                ticket_uuid="ticket-123",
+                run_uuid="run-456",
+                kind="text",
+                summary="Test",
+                unexpected="value",
+            )
+        assert "unexpected" in str(exc_info.value)
+
 
 class TestTextPayload:
     """Tests for TextPayload model."""
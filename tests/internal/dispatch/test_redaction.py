@@ -1,6 +1,18 @@
 """Tests for redaction logic."""
 
-from fulcrum_sdk._internal.dispatch.redaction import REDACTED_VALUE, redact_payload
+import json
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+
+from fulcrum_sdk._internal.dispatch.redaction import (
+    REDACT_KEYS,
+    REDACTED_VALUE,
+    encode_redacted,
+    redact_payload,
+    redact_query,
+)
 
 
 class TestRedactPayload:
@@ -96,6 +108,26 @@ class TestRedactPayload:
         assert result["api_key"] == "visible"
         assert result["name"] == "test"
 
+    def test_skip_redaction_returns_deep_copy(self):
+        """Should return an independent copy when skipping redaction."""
+        nested = {"token": "tok"}
+        payload = {"nested": nested, "items": [nested]}
+        result = redact_payload(payload, skip_redaction=True)
+        assert result == payload
+        assert result["nested"] is not nested
+        assert result["items"][0] is not nested
+
+    def test_skip_redaction_handles_nesting_beyond_codec_limit(self):
+        """Should still copy payloads too deep for the JSON codec."""
+        payload: dict[str, object] = {"leaf": 1}
+        for _ in range(5000):
+            payload = {"child": payload}
+        result = redact_payload(payload, skip_redaction=True)
+        assert result is not payload
+        for _ in range(5000):
+            result = result["child"]
+        assert result == {"leaf": 1}
+
     def test_does_not_mutate_original(self):
         """Should not mutate the original payload."""
         nested: dict[str, str] = {"token": "tok"}
@@ -138,3 +170,102 @@ class TestRedactPayload:
         result = redact_payload(payload)
         assert result["refresh_token"] == REDACTED_VALUE
         assert result["expires_in"] == 3600
+
+    def test_handles_nesting_beyond_recursion_limit(self):
+        """Should redact payloads nested deeper than the interpreter recursion limit."""
+        payload: dict[str, object] = {"secret": "deep"}
+        for _ in range(5000):
+            payload = {"child": [payload]}
+        result = redact_payload(payload)
+        for _ in range(5000):
+            result = result["child"][0]
+        assert result == {"secret": REDACTED_VALUE}
+
+    def test_returns_copy_with_original_value_types(self):
+        """Should copy payloads without sensitive keys and keep their value types."""
+        created = datetime(2024, 1, 2, tzinfo=UTC)
+        payload: dict[Any, Any] = {
+            "name": "test",
+            1: (1, 2),
+            "created": created,
+            "items": [{"id": 1}],
+        }
+        result = redact_payload(payload)
+        assert result == payload
+        assert result is not payload
+        assert result["items"][0] is not payload["items"][0]
+        assert result["created"] is created
+
+    def test_redacts_whole_value_of_sensitive_key(self):
+        """Should replace a sensitive key's value whole, including nested containers."""
+        payload = {"credentials": {"token": "tok", "user": "u"}, "items": [{"id": 1}]}
+        result = redact_payload(payload)
+        assert result == {"credentials": REDACTED_VALUE, "items": [{"id": 1}]}
+        assert payload["credentials"] == {"token": "tok", "user": "u"}
+
+    def test_ignores_sensitive_names_inside_strings(self):
+        """Should only redact real keys, not look-alikes inside strings."""
+        payload = {'x"token': "keep", "note": 'sent {"password":"x"}', "secret": "s"}
+        result = redact_payload(payload)
+        assert result == {**payload, "secret": REDACTED_VALUE}
+
+    def test_redacts_kelvin_sign_keys(self):
+        """Should catch keys that only lowercase to a sensitive key."""
+        result = redact_payload({"TOKEN": "tok"})
+        assert result["TOKEN"] == REDACTED_VALUE
+
+    def test_redact_keys_are_lowercase(self):
+        """Should keep REDACT_KEYS lowercase, as key lookups only lowercase the key."""
+        assert all(key == key.lower() for key in REDACT_KEYS)
+
+
+class TestEncodeRedacted:
+    """Tests for encode_redacted function."""
+
+    def test_encodes_payload_without_sensitive_keys(self):
+        """Should encode a payload without sensitive keys unchanged."""
+        assert encode_redacted({"name": "test", "count": 2}) == b'{"name":"test","count":2}'
+
+    def test_redacts_before_encoding(self):
+        """Should redact sensitive keys at any depth."""
+        payload = {"config": {"api_key": "secret", "host": "localhost"}}
+        result = json.loads(encode_redacted(payload))
+        assert result == {"config": {"api_key": REDACTED_VALUE, "host": "localhost"}}
+        assert payload["config"]["api_key"] == "secret"
+
+    def test_keeps_other_bytes_unchanged(self):
+        """Should splice in the redacted value and leave the rest of the encoding as-is."""
+        payload = {"a": [1, {"api_key": {"nested": True}}], "name": "café", "token": None}
+        assert encode_redacted(payload) == (
+            '{"a":[1,{"api_key":"[REDACTED]"}],"name":"café","token":"[REDACTED]"}'.encode()
+        )
+
+    def test_skip_redaction_flag(self):
+        """Should encode sensitive values as-is when skipping redaction."""
+        assert encode_redacted({"token": "visible"}, skip_redaction=True) == b'{"token":"visible"}'
+
+    def test_unencodable_payload_raises(self):
+        """Should raise TypeError for a payload the codec can't encode, even if redacted."""
+        with pytest.raises(TypeError):
+            encode_redacted({"name": object()})
+        with pytest.raises(TypeError):
+            encode_redacted({"token": object()})
+
+
+class TestRedactQuery:
+    """Tests for redact_query function."""
+
+    def test_redacts_quoted_values(self):
+        """Should redact quoted values assigned to sensitive keys."""
+        query = "UPDATE users SET password = 'it''s', name = 'bob'"
+        assert redact_query(query) == "UPDATE users SET password = '[REDACTED]', name = 'bob'"
+
+    def test_redacts_bare_values_case_insensitively(self):
+        """Should redact unquoted values regardless of key case."""
+        query = "SELECT * FROM t WHERE API_KEY=abc123 AND id = 1"
+        assert redact_query(query) == "SELECT * FROM t WHERE API_KEY='[REDACTED]' AND id = 1"
+
+    def test_ignores_keys_inside_identifiers(self):
+        """Should leave identifiers that merely contain a sensitive key alone."""
+        query = "SELECT token_count FROM usage WHERE my_token_id = 7"
+        assert redact_query(query) == query
@@ -0,0 +1,21 @@
+"""Shared fixtures for improvements tests."""
+
+import pytest
+
+from fulcrum_sdk._internal.improvements.client import ImprovementsClient
+
+
+@pytest.fixture
+def client(transport):
+    """Return an enabled client for http://test/improvements, closed after the test.
+
+    Its sync requests go through `transport`.
+    """
+    client = ImprovementsClient(
+        improvements_url="http://test/improvements",
+        run_token="token",
+        run_uuid="run",
+        transport=transport,
+    )
+    yield client
+    client.close()
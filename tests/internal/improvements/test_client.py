@@ -1,22 +1,34 @@
 """Tests for ImprovementsClient."""
 
-import os
+import asyncio
+import gc
+import json
+import threading
+import time
+import uuid
+import weakref
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
 from unittest.mock import patch
 
 import httpx
 import pytest
 import respx
 
+from fulcrum_sdk._internal import http as http_module
+from fulcrum_sdk._internal.http import HTTP2_AVAILABLE
+from fulcrum_sdk._internal.improvements import client as client_module
 from fulcrum_sdk._internal.improvements.client import (
     ImprovementsClient,
     get_improvements_client,
 )
+from fulcrum_sdk._version import __version__
 
 
 class TestImprovementsClientFromEnv:
     """Tests for ImprovementsClient.from_env()."""
 
-    def test_from_env_with_all_vars(self):
+    def test_from_env_with_all_vars(self, set_env):
         """Should create enabled client when all vars are set."""
         env = {
             "FULCRUM_IMPROVEMENTS_URL": "http://localhost:3000/api/improvements",
@@ -25,41 +37,41 @@ class TestImprovementsClientFromEnv:
             "FULCRUM_TICKET_UUID": "ticket-123",
             "FULCRUM_RUN_UUID": "run-456",
         }
-        with patch.dict(os.environ, env, clear=True):
-            client = ImprovementsClient.from_env()
-            assert client.enabled is True
+        set_env(env)
+        client = ImprovementsClient.from_env()
+        assert client.enabled is True
 
-    def test_from_env_missing_url(self):
+    def test_from_env_missing_url(self, set_env):
         """Should create disabled client when URL is missing."""
         env = {
             "FULCRUM_RUN_TOKEN": "test-token",
             "FULCRUM_RUN_UUID": "run-456",
         }
-        with patch.dict(os.environ, env, clear=True):
-            client = ImprovementsClient.from_env()
-            assert client.enabled is False
+        set_env(env)
+        client = ImprovementsClient.from_env()
+        assert client.enabled is False
 
-    def test_from_env_missing_token(self):
+    def test_from_env_missing_token(self, set_env):
         """Should create disabled client when token is missing."""
         env = {
             "FULCRUM_IMPROVEMENTS_URL": "http://localhost:3000/api/improvements",
             "FULCRUM_RUN_UUID": "run-456",
         }
-        with patch.dict(os.environ, env, clear=True):
-            client = ImprovementsClient.from_env()
-            assert client.enabled is False
+        set_env(env)
+        client = ImprovementsClient.from_env()
+        assert client.enabled is False
 
-    def test_from_env_missing_run_uuid(self):
+    def test_from_env_missing_run_uuid(self, set_env):
         """Should create disabled client when run_uuid is missing."""
         env = {
             "FULCRUM_IMPROVEMENTS_URL": "http://localhost:3000/api/improvements",
             "FULCRUM_RUN_TOKEN": "test-token",
         }
-        with patch.dict(os.environ, env, clear=True):
-            client = ImprovementsClient.from_env()
-            assert client.enabled is False
+        set_env(env)
+        client = ImprovementsClient.from_env()
+        assert client.enabled is False
 
-    def test_from_env_prefers_run_token(self):
+    def test_from_env_prefers_run_token(self, set_env):
         """Should prefer FULCRUM_RUN_TOKEN over FULCRUM_DISPATCH_TOKEN."""
         env = {
             "FULCRUM_IMPROVEMENTS_URL": "http://localhost:3000/api/improvements",
@@ -67,24 +79,24 @@ class TestImprovementsClientFromEnv:
             "FULCRUM_DISPATCH_TOKEN": "deprecated-token",
             "FULCRUM_RUN_UUID": "run-456",
         }
-        with patch.dict(os.environ, env, clear=True):
-            client = ImprovementsClient.from_env()
-            assert client.enabled is True
-            assert client._run_token == "preferred-token"
+        set_env(env)
+        client = ImprovementsClient.from_env()
+        assert client.enabled is True
+        assert client._run_token == "preferred-token"
 
-    def test_from_env_fallback_to_dispatch_token(self):
+    def test_from_env_fallback_to_dispatch_token(self, set_env):
         """Should fallback to FULCRUM_DISPATCH_TOKEN when RUN_TOKEN is missing."""
         env = {
             "FULCRUM_IMPROVEMENTS_URL": "http://localhost:3000/api/improvements",
             "FULCRUM_DISPATCH_TOKEN": "fallback-token",
             "FULCRUM_RUN_UUID": "run-456",
         }
-        with patch.dict(os.environ, env, clear=True):
-            client = ImprovementsClient.from_env()
-            assert client.enabled is True
-            assert client._run_token == "fallback-token"
+        set_env(env)
+        client = ImprovementsClient.from_env()
+        assert client.enabled is True
+        assert client._run_token == "fallback-token"
 
-    def test_from_env_with_optional_settings(self):
+    def test_from_env_with_optional_settings(self, set_env):
         """Should parse optional settings from env."""
         env = {
             "FULCRUM_IMPROVEMENTS_URL": "http://localhost:3000/api/improvements",
@@ -93,104 +105,231 @@ class TestImprovementsClientFromEnv:
             "FULCRUM_IMPROVEMENTS_DEBUG": "1",
             "FULCRUM_IMPROVEMENTS_TIMEOUT_MS": "3000",
             "FULCRUM_IMPROVEMENTS_MAX_BYTES": "32768",
+            "FULCRUM_IMPROVEMENTS_MAX_CONNECTIONS": "10",
+            "FULCRUM_IMPROVEMENTS_MAX_KEEPALIVE": "5",
+            "FULCRUM_IMPROVEMENTS_LIST_CACHE_TTL_MS": "2500",
         }
-        with patch.dict(os.environ, env, clear=True):
-            client = ImprovementsClient.from_env()
-            assert client._debug is True
-            assert client._timeout_ms == 3000
-            assert client._max_bytes == 32768
+        set_env(env)
+        client = ImprovementsClient.from_env()
+        assert client._debug is True
+        assert client._timeout_ms == 3000
+        assert client._max_bytes == 32768
+        assert client._limits["max_connections"] == 10
+        assert client._limits["max_keepalive_connections"] == 5
+        assert client._list_cache_ttl_s == 2.5
+
+    def test_from_env_malformed_integer_raises(self, set_env):
+        """Should raise ValueError when a numeric setting is not a valid integer."""
+        for name in (
+            "FULCRUM_IMPROVEMENTS_TIMEOUT_MS",
+            "FULCRUM_IMPROVEMENTS_MAX_BYTES",
+            "FULCRUM_IMPROVEMENTS_MAX_CONNECTIONS",
+            "FULCRUM_IMPROVEMENTS_MAX_KEEPALIVE",
+            "FULCRUM_IMPROVEMENTS_LIST_CACHE_TTL_MS",
+        ):
+            set_env({
+                "FULCRUM_IMPROVEMENTS_URL": "http://localhost:3000/api/improvements",
+                "FULCRUM_RUN_TOKEN": "test-token",
+                "FULCRUM_RUN_UUID": "run-456",
+                name: "not_a_number",
+            })
+            with pytest.raises(ValueError):
+                ImprovementsClient.from_env()
 
 
 class TestImprovementsClientNoOp:
     """Tests for no-op client behavior."""
 
-    def test_noop_list_returns_empty_list(self):
-        """No-op client should return empty list for list_improvements."""
+    def test_noop_operations_do_nothing(self):
+        """No-op client should return [] from list and False from every other operation."""
         client = ImprovementsClient()  # No config = no-op
         assert client.enabled is False
         assert client.list_improvements() == []
-
-    def test_noop_create_returns_false(self):
-        """No-op client should return False for create_improvement."""
-        client = ImprovementsClient()
         assert client.create_improvement("Test") is False
-
-    def test_noop_update_returns_false(self):
-        """No-op client should return False for update_improvement."""
-        client = ImprovementsClient()
         assert client.update_improvement("uuid", title="New") is False
-
-    def test_noop_delete_returns_false(self):
-        """No-op client should return False for delete_improvement."""
-        client = ImprovementsClient()
         assert client.delete_improvement("uuid") is False
+        assert client.emit_improvement_event("uuid", "action") is False
+        assert client._client is None
 
-    def test_noop_emit_event_returns_false(self):
-        """No-op client should return False for emit_improvement_event."""
-        client = ImprovementsClient()
+    def test_noop_list_returns_fresh_list(self):
+        """Should return a new list on every call, so callers can mutate it."""
+        for client in (ImprovementsClient(), client_module._NoopImprovementsClient()):
+            first = client.list_improvements()
+            first.append(None)
+            assert client.list_improvements() == []
+
+    async def test_from_env_returns_noop_client_when_unconfigured(self, set_env):
+        """Should return the no-op subclass, whose operations never send."""
+        set_env({})
+        client = ImprovementsClient.from_env()
+
+        assert isinstance(client, client_module._NoopImprovementsClient)
+        assert client.enabled is False
+        assert client.list_improvements() == []
+        assert client.create_improvement("Test") is False
         assert client.emit_improvement_event("uuid", "action") is False
+        assert await client.alist_improvements() == []
+        assert await client.aupdate_improvement("uuid", title="New") is False
+        assert client._client is None
+        assert client._async_client is None
+
+    def test_clients_use_slots(self):
+        """Should keep all state in slots rather than an instance dict."""
+        for client in (ImprovementsClient(), client_module._NoopImprovementsClient()):
+            assert not hasattr(client, "__dict__")
+            with pytest.raises(AttributeError):
+                client.unexpected = True  # type: ignore[attr-defined]
+
+
+_URL = "http://test/improvements"
+_ITEM_URL = "http://test/improvements/uuid-123"
+_EVENTS_URL = "http://test/improvements/uuid-123/events"
+_IMPROVEMENT = {"uuid": "imp-1", "project_uuid": "proj-1", "title": "Test Improvement"}
+_LIST_RESPONSE = httpx.Response(200, json={"improvements": [{**_IMPROVEMENT, "status": "open"}]})
+_EMPTY_LIST_RESPONSE = httpx.Response(200, content=b'{"improvements":[]}')
 
 
 class TestImprovementsClientOperations:
     """Tests for ImprovementsClient CRUD operations."""
 
-    @respx.mock
-    def test_list_improvements_success(self):
+    def test_list_improvements_success(self, client, transport):
         """Should return list of improvements on success."""
-        route = respx.get("http://test/improvements").mock(
-            return_value=httpx.Response(
+        transport.respond("GET", _URL, _LIST_RESPONSE)
+
+        result = client.list_improvements()
+
+        assert len(result) == 1
+        assert result[0].uuid == "imp-1"
+        assert result[0].title == "Test Improvement"
+        assert len(transport.requests) == 1
+
+    def test_list_improvements_bare_list(self, client, transport):
+        """Should accept a bare list response."""
+        transport.respond(
+            "GET", _URL, httpx.Response(200, json=[{**_IMPROVEMENT, "title": "Bare"}])
+        )
+
+        result = client.list_improvements()
+
+        assert [imp.title for imp in result] == ["Bare"]
+
+    def test_list_improvements_bare_list_with_leading_whitespace(self, client, transport):
+        """Should detect a bare list even when the body starts with whitespace."""
+        transport.respond(
+            "GET",
+            _URL,
+            httpx.Response(
+                200, content=b'\n  [{"uuid": "imp-1", "project_uuid": "proj-1", "title": "Spaced"}]'
+            ),
+        )
+
+        assert [imp.title for imp in client.list_improvements()] == ["Spaced"]
+
+    def test_list_improvements_envelope_extra_keys(self, client, transport):
+        """Should ignore other top-level keys and treat a missing list as empty."""
+        transport.respond(
+            "GET",
+            _URL,
+            httpx.Response(
                 200,
                 json={
-                    "improvements": [
-                        {
-                            "uuid": "imp-1",
-                            "project_uuid": "proj-1",
-                            "title": "Test Improvement",
-                            "status": "open",
-                        }
-                    ]
+                    "improvements": [{"uuid": "i", "project_uuid": "p", "title": "Wrapped"}],
+                    "count": 1,
                 },
-            )
+            ),
+            httpx.Response(200, json={"count": 0}),
+        )
+
+        assert [imp.title for imp in client.list_improvements()] == ["Wrapped"]
+        assert client.list_improvements() == []
+
+    def test_list_improvements_not_cached_by_default(self, client, transport):
+        """Should ask the API on every call unless list caching is enabled."""
+        transport.respond("GET", _URL, _EMPTY_LIST_RESPONSE)
+
+        client.list_improvements()
+        client.list_improvements()
+        assert len(transport.requests) == 2
+
+    def test_list_improvements_cached_until_mutation(self, transport):
+        """Should reuse a fresh list result per project until a mutation is sent."""
+        transport.respond(
+            "GET", _URL, httpx.Response(200, json=[{**_IMPROVEMENT, "title": "Cached"}])
         )
+        transport.respond("POST", _URL, httpx.Response(201))
 
         client = ImprovementsClient(
-            improvements_url="http://test/improvements",
+            improvements_url=_URL,
             run_token="token",
             run_uuid="run",
+            list_cache_ttl_ms=60_000,
+            transport=transport,
         )
-        result = client.list_improvements()
+        first = client.list_improvements()
+        first.clear()
+        assert [imp.title for imp in client.list_improvements()] == ["Cached"]
+        assert len(transport.sent("GET")) == 1
 
-        assert len(result) == 1
-        assert result[0].uuid == "imp-1"
-        assert result[0].title == "Test Improvement"
-        assert route.called
+        client.list_improvements(project_uuid="other")
+        assert len(transport.sent("GET")) == 2
 
-    @respx.mock
-    def test_list_improvements_server_error(self):
-        """Should return empty list on server error."""
-        respx.get("http://test/improvements").mock(return_value=httpx.Response(500))
+        client.create_improvement("New")
+        client.list_improvements()
+        assert len(transport.sent("GET")) == 3
+
+    def test_list_improvements_cache_expires(self, transport):
+        """Should ask the API again once the cached result has expired."""
+        transport.respond("GET", _URL, _EMPTY_LIST_RESPONSE)
 
         client = ImprovementsClient(
-            improvements_url="http://test/improvements",
+            improvements_url=_URL,
             run_token="token",
             run_uuid="run",
+            list_cache_ttl_ms=1000,
+            transport=transport,
         )
+        now = 0.0
+        with patch.object(client_module.time, "monotonic", lambda: now):
+            client.list_improvements()
+            now = 0.5
+            client.list_improvements()
+            assert len(transport.requests) == 1
+            now = 1.5
+            client.list_improvements()
+        assert len(transport.requests) == 2
+
+    def test_list_improvements_server_error(self, client, transport):
+        """Should return empty list on server error."""
+        transport.respond("GET", _URL, httpx.Response(500))
+
         result = client.list_improvements()
         assert result == []
 
-    @respx.mock
-    def test_create_improvement_success(self):
-        """Should return True on successful create."""
-        route = respx.post("http://test/improvements").mock(
-            return_value=httpx.Response(201, json={"uuid": "new-uuid"})
+    def test_list_improvements_invalid_item(self, client, transport):
+        """Should return empty list when an item fails validation."""
+        transport.respond(
+            "GET", _URL, httpx.Response(200, json=[{**_IMPROVEMENT, "title": "Ok"}, {"uuid": 2}])
         )
 
+        assert client.list_improvements() == []
+
+    def test_list_improvements_invalid_json(self, client, transport):
+        """Should return empty list when the response body is not JSON."""
+        transport.respond("GET", _URL, httpx.Response(200, content=b"<html>oops</html>"))
+
+        assert client.list_improvements() == []
+
+    def test_create_improvement_success(self, transport):
+        """Should return True on successful create."""
+        transport.respond("POST", _URL, httpx.Response(201, json={"uuid": "new-uuid"}))
+
         client = ImprovementsClient(
-            improvements_url="http://test/improvements",
+            improvements_url=_URL,
             run_token="token",
             run_uuid="run",
             project_uuid="project",
             ticket_uuid="ticket",
+            transport=transport,
         )
         result = client.create_improvement(
             title="New Improvement",
@@ -199,130 +338,719 @@ class TestImprovementsClientOperations:
         )
 
         assert result is True
-        assert route.called
+        assert len(transport.requests) == 1
 
         # Verify request body
-        request = route.calls.last.request
-        body = request.content.decode()
-        assert "New Improvement" in body
-        assert "run" in body
-        assert "project" in body
+        body = transport.requests[-1].content
+        assert b"New Improvement" in body
+        assert b"run" in body
+        assert b"project" in body
 
-    @respx.mock
-    def test_create_improvement_server_error(self):
-        """Should return False on server error."""
-        respx.post("http://test/improvements").mock(return_value=httpx.Response(500))
+    def test_create_improvement_sends_encoded_json(self, client, transport):
+        """Should send a compact JSON body with a JSON content type."""
+        transport.respond("POST", _URL, httpx.Response(201))
+
+        client.create_improvement(title="Café")
+
+        request = transport.requests[-1]
+        assert request.headers["content-type"] == "application/json"
+        assert request.content == '{"run_uuid":"run","title":"Café","status":"open"}'.encode()
+
+    def test_create_improvement_encodes_all_fields_in_order(self, transport):
+        """Should encode every set field, escaped and in ImprovementCreate order."""
+        transport.respond("POST", _URL, httpx.Response(201))
 
         client = ImprovementsClient(
-            improvements_url="http://test/improvements",
+            improvements_url=_URL,
             run_token="token",
             run_uuid="run",
+            project_uuid="project",
+            ticket_uuid="ticket",
+            transport=transport,
         )
+        client.create_improvement(
+            title='Say "hi"', description="Line\nbreak", dedupe_key="key", status="in_progress"
+        )
+
+        assert transport.requests[-1].content == (
+            b'{"run_uuid":"run","title":"Say \\"hi\\"","description":"Line\\nbreak",'
+            b'"dedupe_key":"key","status":"in_progress","project_uuid":"project",'
+            b'"ticket_uuid":"ticket"}'
+        )
+
+    def test_create_improvement_rejects_invalid_fields(self, client, transport):
+        """Should return False without sending when fields break the contract."""
+        transport.respond("POST", _URL, httpx.Response(201))
+
+        assert client.create_improvement(title="x" * 257) is False
+        assert client.create_improvement(title="Ok", dedupe_key="k" * 257) is False
+        assert client.create_improvement(title="Ok", status="done") is False  # type: ignore[arg-type]
+        assert transport.requests == []
+
+    def test_create_improvement_server_error(self, client, transport):
+        """Should return False on server error."""
+        transport.respond("POST", _URL, httpx.Response(500))
+
         result = client.create_improvement(title="Test")
         assert result is False
 
-    @respx.mock
-    def test_update_improvement_success(self):
+    def test_update_improvement_success(self, client, transport):
         """Should return True on successful update."""
-        route = respx.patch("http://test/improvements/uuid-123").mock(
-            return_value=httpx.Response(200, json={"uuid": "uuid-123"})
-        )
+        transport.respond("PATCH", _ITEM_URL, httpx.Response(200, json={"uuid": "uuid-123"}))
+
+        result = client.update_improvement("uuid-123", title="Updated", status="resolved")
+
+        assert result is True
+        assert len(transport.requests) == 1
+
+    def test_update_improvement_sends_only_given_fields(self, client, transport):
+        """Should send the provided fields and reject invalid statuses."""
+        transport.respond("PATCH", _ITEM_URL, httpx.Response(200))
+
+        assert client.update_improvement("uuid-123", status="resolved", title=None) is True
+        assert json.loads(transport.requests[-1].content) == {
+            "run_uuid": "run",
+            "status": "resolved",
+        }
+        assert client.update_improvement("uuid-123", status="done") is False
+        assert len(transport.requests) == 1
+
+    def test_update_improvement_no_valid_fields(self, client, transport):
+        """Should return False when no valid fields provided."""
+        result = client.update_improvement("uuid-123", invalid_field="value")
+        assert result is False
+        assert transport.requests == []
+
+    def test_update_improvement_ignores_unknown_fields(self, client, transport):
+        """Should drop fields ImprovementUpdate doesn't define and send the rest."""
+        transport.respond("PATCH", _ITEM_URL, httpx.Response(200))
+
+        assert client.update_improvement("uuid-123", priority="high", title="T") is True
+        assert json.loads(transport.requests[-1].content) == {"run_uuid": "run", "title": "T"}
+
+    def test_delete_improvement_success(self, client, transport):
+        """Should return True on successful delete."""
+        transport.respond("DELETE", _ITEM_URL, httpx.Response(204))
+
+        result = client.delete_improvement("uuid-123")
+
+        assert result is True
+        assert len(transport.requests) == 1
+
+    def test_item_methods_accept_uuid_objects(self, client, transport):
+        """Should build item URLs from uuid.UUID values and never raise."""
+        improvement_uuid = uuid.UUID("12345678-1234-5678-1234-567812345678")
+        item_url = f"{_URL}/{improvement_uuid}"
+        transport.respond("PATCH", item_url, httpx.Response(200))
+        transport.respond("DELETE", item_url, httpx.Response(204))
+
+        assert client.update_improvement(improvement_uuid, title="Updated") is True
+        assert client.delete_improvement(improvement_uuid) is True
+        assert client.emit_improvement_event(improvement_uuid, "resolved") is False
+        assert [str(request.url.copy_with(query=None)) for request in transport.requests] == [
+            item_url,
+            item_url,
+        ]
+
+    def test_item_urls_ignore_trailing_slash(self, transport):
+        """Should not double the slash when the base URL ends with one."""
+        transport.respond("DELETE", _ITEM_URL, httpx.Response(204))
 
         client = ImprovementsClient(
-            improvements_url="http://test/improvements",
+            improvements_url=_URL + "/",
             run_token="token",
             run_uuid="run",
+            transport=transport,
+        )
+        assert client.delete_improvement("uuid-123") is True
+        assert len(transport.requests) == 1
+
+    def test_emit_event_success(self, client, transport):
+        """Should return True on successful event emission."""
+        transport.respond("POST", _EVENTS_URL, httpx.Response(201, json={"uuid": "event-uuid"}))
+
+        result = client.emit_improvement_event(
+            "uuid-123", "resolved", payload={"reason": "fixed"}
         )
-        result = client.update_improvement("uuid-123", title="Updated", status="resolved")
 
         assert result is True
-        assert route.called
+        assert len(transport.requests) == 1
+
+    def test_emit_event_body(self, client, transport):
+        """Should send the event fields, with or without a payload, and reject overlong actions."""
+        transport.respond("POST", _EVENTS_URL, httpx.Response(201))
+
+        client.emit_improvement_event("uuid-123", "resolved", payload={"reason": "fixed"})
+
+        assert transport.requests[-1].content == (
+            b'{"run_uuid":"run","improvement_uuid":"uuid-123","action":"resolved",'
+            b'"payload":{"reason":"fixed"}}'
+        )
+        client.emit_improvement_event("uuid-123", "opened")
+        assert transport.requests[-1].content == (
+            b'{"run_uuid":"run","improvement_uuid":"uuid-123","action":"opened"}'
+        )
+        assert client.emit_improvement_event("uuid-123", "a" * 65) is False
+        assert len(transport.requests) == 2
+
+    def test_emit_event_redacts_payload(self, client, transport):
+        """Should redact sensitive keys in payload."""
+        transport.respond("POST", _EVENTS_URL, httpx.Response(201))
+
+        client.emit_improvement_event(
+            "uuid-123", "action", payload={"api_key": "secret123", "data": "visible"}
+        )
+
+        body = transport.requests[-1].content
+        assert b"secret123" not in body
+        assert b"[REDACTED]" in body
+        assert b"visible" in body
+
+    def test_emit_event_redacts_nested_payload_without_mutating_it(self, client, transport):
+        """Should redact sensitive keys below the top level, leaving the caller's dict intact."""
+        transport.respond("POST", _EVENTS_URL, httpx.Response(201))
+
+        payload = {"request": {"headers": [{"Authorization": "Bearer x"}]}, "ok": True}
+        client.emit_improvement_event("uuid-123", "action", payload=payload)
+
+        body = json.loads(transport.requests[-1].content)
+        assert body["payload"]["request"]["headers"] == [{"Authorization": "[REDACTED]"}]
+        assert body["payload"]["ok"] is True
+        assert payload["request"]["headers"][0]["Authorization"] == "Bearer x"
+
+    def test_emit_event_truncates_large_payload(self, transport):
+        """Should replace payloads over max_bytes with a truncation notice."""
+        transport.respond("POST", _EVENTS_URL, httpx.Response(201))
 
-    @respx.mock
-    def test_update_improvement_no_valid_fields(self):
-        """Should return False when no valid fields provided."""
         client = ImprovementsClient(
-            improvements_url="http://test/improvements",
+            improvements_url=_URL,
             run_token="token",
             run_uuid="run",
+            max_bytes=100,
+            transport=transport,
         )
-        result = client.update_improvement("uuid-123", invalid_field="value")
-        assert result is False
+        client.emit_improvement_event("uuid-123", "action", payload={"data": "é" * 60})
 
-    @respx.mock
-    def test_delete_improvement_success(self):
-        """Should return True on successful delete."""
-        route = respx.delete("http://test/improvements/uuid-123").mock(
-            return_value=httpx.Response(204)
+        body = json.loads(transport.requests[-1].content)
+        # 60 two-byte characters plus the compact JSON framing
+        assert body["payload"] == {"_truncated": True, "_original_size": 131, "_max_size": 100}
+
+    def test_sends_auth_header(self, transport):
+        """Should send authorization header."""
+        transport.respond("GET", _URL, _EMPTY_LIST_RESPONSE)
+
+        client = ImprovementsClient(
+            improvements_url=_URL,
+            run_token="secret-token",
+            run_uuid="run",
+            transport=transport,
         )
+        client.list_improvements()
+
+        assert transport.requests[-1].headers["authorization"] == "Bearer secret-token"
+
+    def test_sends_same_base_headers_on_every_request(self, client, transport):
+        """Should send the pooled client's base headers unchanged on every request."""
+        transport.respond("GET", _URL, _EMPTY_LIST_RESPONSE)
+        transport.respond("POST", _URL, httpx.Response(201))
+
+        client.list_improvements()
+        client.create_improvement("Test")
+
+        sent = [
+            {name: request.headers[name] for name in ("authorization", "user-agent")}
+            for request in transport.requests
+        ]
+        assert sent == [
+            {"authorization": "Bearer token", "user-agent": f"fulcrum-sdk/{__version__}"}
+        ] * 2
+
+
+class TestImprovementsClientConnectionReuse:
+    """Tests for the pooled HTTP client."""
+
+    def test_reuses_http_client_across_calls(self, client, transport):
+        """Should reuse one pooled HTTP client across requests."""
+        transport.respond("GET", _URL, _EMPTY_LIST_RESPONSE)
+        transport.respond("DELETE", _ITEM_URL, httpx.Response(204))
+
+        client.list_improvements()
+        http_client = client._client
+        client.delete_improvement("uuid-123")
+
+        assert http_client is not None
+        assert client._client is http_client
+
+    def test_parses_each_url_once(self, client, transport):
+        """Should parse a request URL once and reuse it for later requests."""
+        transport.respond("POST", _URL, httpx.Response(201))
+        transport.respond("POST", _EVENTS_URL, httpx.Response(201))
+
+        assert client.create_improvement("First") is True
+        assert client.emit_improvement_event("uuid-123", "opened") is True
+        parsed = dict(client._parsed_urls)
+        assert client.create_improvement("Second") is True
+        assert client.emit_improvement_event("uuid-123", "resolved") is True
+
+        assert list(parsed) == [_URL, _EVENTS_URL]
+        assert all(client._parsed_urls[url] is parsed[url] for url in parsed)
+        assert len(transport.requests) == 4
+
+    def test_bounds_parsed_urls(self, client, transport):
+        """Should start over rather than remember every improvement's URL."""
+        with patch.object(client_module, "MAX_PARSED_URLS", 2):
+            for uuid in ("a", "b", "c"):
+                client.delete_improvement(uuid)
+
+        assert list(client._parsed_urls) == ["http://test/improvements/c"]
+        assert [str(request.url) for request in transport.requests] == [
+            "http://test/improvements/a?run_uuid=run",
+            "http://test/improvements/b?run_uuid=run",
+            "http://test/improvements/c?run_uuid=run",
+        ]
+
+    def test_reuses_tcp_connection_across_calls(self):
+        """Should send consecutive requests over one kept-alive connection."""
+        client_ports: list[int] = []
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                client_ports.append(self.client_address[1])
+                body = b'{"improvements":[]}'
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+        thread.start()
+        try:
+            with ImprovementsClient(
+                improvements_url=f"http://127.0.0.1:{server.server_address[1]}/improvements",
+                run_token="token",
+                run_uuid="run",
+            ) as client:
+                assert client.list_improvements() == []
+                assert client.list_improvements() == []
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert len(client_ports) == 2
+        assert client_ports[0] == client_ports[1]
+
+    def test_http2_enabled_when_available(self):
+        """Should request HTTP/2 on the pooled clients when h2 is installed."""
+        with ImprovementsClient(
+            improvements_url="http://test/improvements",
+            run_token="token",
+            run_uuid="run",
+        ) as client:
+            assert client._get_client()._transport._pool._http2 is HTTP2_AVAILABLE
+
+    async def test_headers_are_set_once_on_pooled_clients(self):
+        """Should bake the auth and content-type headers into both pooled clients."""
+        async with ImprovementsClient(
+            improvements_url="http://test/improvements",
+            run_token="secret-token",
+            run_uuid="run",
+        ) as client:
+            for http_client in (client._get_client(), client._get_async_client()):
+                assert http_client.headers["authorization"] == "Bearer secret-token"
+                assert http_client.headers["content-type"] == "application/json"
+            client.close()
+
+    def test_concurrent_first_use_creates_one_client(self, transport):
+        """Should build a single pooled client when threads race to first use it."""
+        created = []
+        create_http_client = client_module.create_http_client
+
+        def slow_create(**kwargs):
+            time.sleep(0.01)
+            created.append(create_http_client(**kwargs))
+            return created[-1]
 
         client = ImprovementsClient(
             improvements_url="http://test/improvements",
             run_token="token",
             run_uuid="run",
+            transport=transport,
         )
-        result = client.delete_improvement("uuid-123")
+        barrier = threading.Barrier(8)
+        results = []
 
-        assert result is True
-        assert route.called
+        def first_use():
+            barrier.wait()
+            results.append(client._get_client())
+
+        with patch.object(client_module, "create_http_client", slow_create):
+            threads = [threading.Thread(target=first_use) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert len(created) == 1
+        assert all(result is created[0] for result in results)
+        client.close()
+
+    def test_applies_pool_limits(self):
+        """Should apply connection limits and keep-alive expiry to the pooled client."""
+        client = ImprovementsClient(
+            improvements_url="http://test/improvements",
+            run_token="token",
+            run_uuid="run",
+            max_connections=10,
+            max_keepalive=5,
+        )
+        with client:
+            pool = client._get_client()._transport._pool
+            assert pool._max_connections == 10
+            assert pool._max_keepalive_connections == 5
+            assert pool._keepalive_expiry == client_module.KEEPALIVE_EXPIRY_S
+
+    async def test_caps_connect_timeout_on_pooled_clients(self):
+        """Should fail fast on connecting while reads get the full timeout_ms."""
+        async with ImprovementsClient(
+            improvements_url="http://test/improvements",
+            run_token="token",
+            run_uuid="run",
+            timeout_ms=2000,
+        ) as client:
+            for http_client in (client._get_client(), client._get_async_client()):
+                assert http_client.timeout == httpx.Timeout(2.0, connect=0.5)
+            client.close()
 
     @respx.mock
-    def test_emit_event_success(self):
-        """Should return True on successful event emission."""
-        route = respx.post("http://test/improvements/uuid-123/events").mock(
-            return_value=httpx.Response(201, json={"uuid": "event-uuid"})
+    def test_context_manager_closes_http_client(self):
+        """Should close the pooled client when leaving a with block."""
+        respx.get("http://test/improvements").mock(
+            return_value=httpx.Response(200, json={"improvements": []})
         )
 
+        with ImprovementsClient(
+            improvements_url="http://test/improvements",
+            run_token="token",
+            run_uuid="run",
+        ) as client:
+            client.list_improvements()
+            http_client = client._client
+
+        assert http_client is not None
+        assert http_client.is_closed
+        assert client._client is None
+        assert client.list_improvements() == []
+
+    def test_open_client_closed_at_exit_until_closed(self, client, transport):
+        """Should register an open client with the exit hook, and drop it on close."""
+        transport.respond("GET", _URL, _EMPTY_LIST_RESPONSE)
+
+        client.list_improvements()
+        assert client in http_module._open_clients
+
+        client.close()
+        assert client not in http_module._open_clients
+
+    def test_unreferenced_client_is_collected(self, transport):
+        """Should not keep a dropped client and its pool alive until exit."""
+        transport.respond("GET", _URL, _EMPTY_LIST_RESPONSE)
         client = ImprovementsClient(
+            improvements_url=_URL, run_token="token", run_uuid="run", transport=transport
+        )
+        client.list_improvements()
+        ref = weakref.ref(client)
+
+        del client
+        gc.collect()
+
+        assert ref() is None
+
+
+class TestImprovementsClientAsync:
+    """Tests for the async operation variants."""
+
+    def _client(self) -> ImprovementsClient:
+        return ImprovementsClient(
             improvements_url="http://test/improvements",
             run_token="token",
             run_uuid="run",
         )
-        result = client.emit_improvement_event(
-            "uuid-123", "resolved", payload={"reason": "fixed"}
+
+    @respx.mock
+    async def test_alist_improvements_success(self):
+        """Should return parsed improvements."""
+        respx.get("http://test/improvements").mock(
+            return_value=httpx.Response(
+                200,
+                json=[{"uuid": "imp-1", "project_uuid": "proj-1", "title": "Test"}],
+            )
         )
 
-        assert result is True
-        assert route.called
+        async with self._client() as client:
+            result = await client.alist_improvements()
+
+        assert [imp.uuid for imp in result] == ["imp-1"]
 
     @respx.mock
-    def test_emit_event_redacts_payload(self):
-        """Should redact sensitive keys in payload."""
-        route = respx.post("http://test/improvements/uuid-123/events").mock(
+    async def test_async_mutations_succeed(self):
+        """Should return True for successful create/update/delete/emit."""
+        respx.post("http://test/improvements").mock(return_value=httpx.Response(201))
+        respx.patch("http://test/improvements/uuid-123").mock(return_value=httpx.Response(200))
+        respx.delete("http://test/improvements/uuid-123").mock(return_value=httpx.Response(204))
+        events = respx.post("http://test/improvements/uuid-123/events").mock(
             return_value=httpx.Response(201)
         )
 
-        client = ImprovementsClient(
+        async with self._client() as client:
+            assert await client.acreate_improvement("New") is True
+            assert await client.aupdate_improvement("uuid-123", status="resolved") is True
+            assert await client.adelete_improvement("uuid-123") is True
+            assert await client.aemit_improvement_event(
+                "uuid-123", "resolved", payload={"token": "secret"}
+            ) is True
+
+        body = json.loads(events.calls.last.request.content)
+        assert body["payload"] == {"token": "[REDACTED]"}
+
+    @respx.mock
+    async def test_async_creates_run_concurrently(self):
+        """Should keep concurrent requests in flight together on the shared client."""
+        in_flight = 0
+        peak = 0
+
+        async def respond(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(201)
+
+        respx.post("http://test/improvements").mock(side_effect=respond)
+
+        async with self._client() as client:
+            creates = (client.acreate_improvement(f"New {i}") for i in range(10))
+            results = await asyncio.gather(*creates)
+
+        assert results == [True] * 10
+        assert peak == 10
+
+    @respx.mock
+    async def test_async_item_methods_accept_uuid_objects(self):
+        """Should build item URLs from uuid.UUID values and never raise."""
+        improvement_uuid: Any = uuid.UUID("12345678-1234-5678-1234-567812345678")
+        item_url = f"http://test/improvements/{improvement_uuid}"
+        respx.patch(item_url).mock(return_value=httpx.Response(200))
+        respx.delete(item_url).mock(return_value=httpx.Response(204))
+
+        async with self._client() as client:
+            assert await client.aupdate_improvement(improvement_uuid, title="Updated") is True
+            assert await client.adelete_improvement(improvement_uuid) is True
+            assert await client.aemit_improvement_event(improvement_uuid, "resolved") is False
+
+    @respx.mock
+    async def test_async_errors_return_false(self):
+        """Should return False or an empty list instead of raising."""
+        respx.get("http://test/improvements").mock(side_effect=httpx.TimeoutException("timeout"))
+        respx.post("http://test/improvements").mock(return_value=httpx.Response(500))
+
+        async with self._client() as client:
+            assert await client.alist_improvements() == []
+            assert await client.acreate_improvement("New") is False
+            assert await client.aupdate_improvement("uuid-123", invalid_field="value") is False
+
+    async def test_async_noop_client(self):
+        """Disabled clients should skip the network entirely."""
+        client = ImprovementsClient()
+        assert await client.alist_improvements() == []
+        assert await client.aemit_improvement_event("uuid", "action") is False
+        assert client._async_client is None
+
+
+class TestImprovementsClientBackground:
+    """Tests for background (queued) sending."""
+
+    def _client(self) -> ImprovementsClient:
+        return ImprovementsClient(
             improvements_url="http://test/improvements",
             run_token="token",
             run_uuid="run",
+            background=True,
         )
-        client.emit_improvement_event(
-            "uuid-123", "action", payload={"api_key": "secret123", "data": "visible"}
+
+    @respx.mock
+    def test_background_requests_sent_on_flush(self):
+        """Should queue mutations and send them from the worker thread."""
+        create = respx.post("http://test/improvements").mock(return_value=httpx.Response(201))
+        delete = respx.delete("http://test/improvements/uuid-123").mock(
+            return_value=httpx.Response(204)
         )
 
-        request = route.calls.last.request
-        body = request.content.decode()
-        assert "secret123" not in body
-        assert "[REDACTED]" in body
-        assert "visible" in body
+        client = self._client()
+        assert client.create_improvement("New") is True
+        assert client.delete_improvement("uuid-123") is True
+        assert client.flush() is True
+
+        assert create.call_count == 1
+        assert delete.call_count == 1
+        client.close()
 
     @respx.mock
-    def test_sends_auth_header(self):
-        """Should send authorization header."""
-        route = respx.get("http://test/improvements").mock(
-            return_value=httpx.Response(200, json={"improvements": []})
+    def test_background_close_drains_queue(self):
+        """Should send queued requests before closing."""
+        route = respx.post("http://test/improvements/uuid-123/events").mock(
+            return_value=httpx.Response(201)
+        )
+
+        client = self._client()
+        for i in range(5):
+            client.emit_improvement_event("uuid-123", f"action-{i}")
+        client.close()
+
+        assert route.call_count == 5
+        assert client._worker is None
+
+    @respx.mock
+    def test_background_server_error_still_queued(self):
+        """Should report queued requests as accepted even if sending later fails."""
+        respx.post("http://test/improvements").mock(return_value=httpx.Response(500))
+
+        client = self._client()
+        assert client.create_improvement("New") is True
+        assert client.flush() is True
+        client.close()
+
+    @respx.mock
+    def test_background_batches_events(self):
+        """Should coalesce queued events into batch requests."""
+        batch = respx.post("http://test/improvements/events/batch").mock(
+            return_value=httpx.Response(200)
+        )
+        single = respx.post("http://test/improvements/uuid-123/events").mock(
+            return_value=httpx.Response(201)
+        )
+        delete = respx.delete("http://test/improvements/uuid-123").mock(
+            return_value=httpx.Response(204)
         )
 
         client = ImprovementsClient(
             improvements_url="http://test/improvements",
-            run_token="secret-token",
+            run_token="token",
             run_uuid="run",
+            background=True,
+            events_batch_url="http://test/improvements/events/batch",
         )
-        client.list_improvements()
+        for i in range(3):
+            client.emit_improvement_event("uuid-123", f"action-{i}", payload={"token": "t"})
+        client.delete_improvement("uuid-123")
+        client.close()
+
+        assert single.call_count == 0
+        assert delete.call_count == 1
+        events = []
+        for call in batch.calls:
+            body = json.loads(call.request.content)
+            assert body["run_uuid"] == "run"
+            events.extend(body["events"])
+        assert [event["action"] for event in events] == ["action-0", "action-1", "action-2"]
+        assert events[0]["improvement_uuid"] == "uuid-123"
+        assert events[0]["payload"] == {"token": "[REDACTED]"}
+
+    def test_background_batches_keep_request_order(self):
+        """Should end an event batch at a queued non-event request and send it in order."""
+        with respx.mock:
+            respx.post("http://test/improvements/events/batch").mock(
+                return_value=httpx.Response(200)
+            )
+            respx.post("http://test/improvements").mock(return_value=httpx.Response(201))
+
+            client = ImprovementsClient(
+                improvements_url="http://test/improvements",
+                run_token="token",
+                run_uuid="run",
+                background=True,
+                events_batch_url="http://test/improvements/events/batch",
+            )
+            client.emit_improvement_event("uuid-123", "before")
+            client.create_improvement("Between")
+            client.emit_improvement_event("uuid-123", "after")
+            client.close()
+
+            assert [call.request.url.path for call in respx.calls] == [
+                "/improvements/events/batch",
+                "/improvements",
+                "/improvements/events/batch",
+            ]
+
+    def test_background_queue_full_returns_false(self):
+        """Should drop requests and return False when the queue is full."""
+        with (
+            patch.object(client_module, "QUEUE_MAX_SIZE", 1),
+            patch.object(ImprovementsClient, "_start_worker"),
+        ):
+            client = self._client()
+            assert client.delete_improvement("uuid-1") is True
+            assert client.delete_improvement("uuid-2") is False
+
+    def test_list_is_not_queued(self):
+        """Should keep list synchronous, since it returns data."""
+        with respx.mock:
+            respx.get("http://test/improvements").mock(
+                return_value=httpx.Response(200, json={"improvements": []})
+            )
+            client = self._client()
+            assert client.list_improvements() == []
+            assert client._worker is None
+
+    def test_from_env_reads_background(self, set_env):
+        """Should read background mode and the events batch URL from the environment."""
+        env = {
+            "FULCRUM_IMPROVEMENTS_URL": "http://test/improvements",
+            "FULCRUM_RUN_TOKEN": "token",
+            "FULCRUM_RUN_UUID": "run",
+            "FULCRUM_IMPROVEMENTS_BACKGROUND": "1",
+        }
+        env["FULCRUM_IMPROVEMENTS_EVENTS_BATCH_URL"] = "http://test/improvements/events/batch"
+        set_env(env)
+        client = ImprovementsClient.from_env()
+        assert client._background is True
+        assert client._events_batch_url == "http://test/improvements/events/batch"
+
+    async def test_async_exit_drains_queue_without_blocking_loop(self):
+        """Should wait for the worker off the event loop when leaving an async with block."""
+        sending = threading.Event()
+        release = threading.Event()
+        released = []
 
-        request = route.calls.last.request
-        assert request.headers["authorization"] == "Bearer secret-token"
+        def respond(request):
+            sending.set()
+            released.append(release.wait(1))
+            return httpx.Response(204)
+
+        with respx.mock:
+            route = respx.delete("http://test/improvements/uuid-123").mock(side_effect=respond)
+
+            async def release_later():
+                # Only runs if the loop stays free while the worker is joined
+                await asyncio.sleep(0.05)
+                release.set()
+
+            async with self._client() as client:
+                assert client.delete_improvement("uuid-123") is True
+                assert await asyncio.to_thread(sending.wait, 1)
+                releaser = asyncio.create_task(release_later())
+
+            await releaser
+            assert released == [True]
+            assert route.call_count == 1
+            assert client._worker is None
+            assert client._client is None
 
 
 class TestImprovementsClientErrors:
@@ -360,38 +1088,57 @@ class TestImprovementsClientErrors:
         result = client.create_improvement("Test")
         assert result is False
 
-    @respx.mock
-    def test_network_error_returns_false(self):
+    def test_network_error_returns_false(self, client, transport):
         """Should return False on network error."""
-        respx.post("http://test/improvements").mock(
-            side_effect=httpx.ConnectError("connection failed")
-        )
+        transport.respond("POST", _URL, httpx.ConnectError("connection failed"))
 
-        client = ImprovementsClient(
-            improvements_url="http://test/improvements",
-            run_token="token",
-            run_uuid="run",
-        )
         result = client.create_improvement("Test")
         assert result is False
 
+    @respx.mock
+    def test_debug_logs_to_stderr(self, capsys):
+        """Should format and log messages only when debug mode is enabled."""
+        respx.post("http://test/improvements").mock(return_value=httpx.Response(500))
+
+        kwargs = {
+            "improvements_url": "http://test/improvements",
+            "run_token": "token",
+            "run_uuid": "run",
+        }
+        ImprovementsClient(**kwargs).create_improvement("Quiet")
+        assert capsys.readouterr().err == ""
+
+        ImprovementsClient(**kwargs, debug=True).create_improvement("Loud")
+        err = capsys.readouterr().err
+        assert "[fulcrum-sdk:improvements] Creating improvement: Loud" in err
+        assert "[fulcrum-sdk:improvements] Create failed with status 500" in err
+
 
 class TestGetImprovementsClient:
     """Tests for get_improvements_client helper function."""
 
-    def test_returns_client(self):
+    def test_returns_client(self, set_env):
         """Should return an ImprovementsClient instance."""
-        with patch.dict(os.environ, {}, clear=True):
-            client = get_improvements_client()
-            assert isinstance(client, ImprovementsClient)
+        set_env({})
+        client = get_improvements_client()
+        assert isinstance(client, ImprovementsClient)
 
-    def test_uses_from_env(self):
+    def test_uses_from_env(self, set_env):
         """Should configure from environment."""
         env = {
             "FULCRUM_IMPROVEMENTS_URL": "http://test/improvements",
             "FULCRUM_RUN_TOKEN": "token",
             "FULCRUM_RUN_UUID": "run",
         }
-        with patch.dict(os.environ, env, clear=True):
-            client = get_improvements_client()
-            assert client.enabled is True
+        set_env(env)
+        client = get_improvements_client()
+        assert client.enabled is True
+
+    def test_returns_cached_client(self, set_env):
+        """Should read the environment once and reuse the client."""
+        set_env({})
+        client = get_improvements_client()
+        set_env({"FULCRUM_RUN_UUID": "run"})
+        assert get_improvements_client() is client
+        get_improvements_client.cache_clear()
+        assert get_improvements_client() is not client
@@ -0,0 +1,27 @@
+"""Tests for improvements Pydantic models."""
+
+import pytest
+from pydantic import ValidationError
+
+from fulcrum_sdk._internal.improvements.models import Improvement
+
+
+class TestImprovement:
+    """Tests for Improvement model."""
+
+    def test_defaults(self):
+        """Should fill optional fields with defaults."""
+        improvement = Improvement(uuid="imp-1", project_uuid="proj-1", title="Test")
+        assert improvement.status == "open"
+        assert improvement.description is None
+
+    def test_is_frozen(self):
+        """Should reject attribute assignment on API records."""
+        improvement = Improvement(uuid="imp-1", project_uuid="proj-1", title="Test")
+        with pytest.raises(ValidationError):
+            improvement.title = "Changed"
+
+    def test_is_hashable(self):
+        """Should be usable in sets and as dict keys."""
+        improvement = Improvement(uuid="imp-1", project_uuid="proj-1", title="Test")
+        assert improvement in {improvement}
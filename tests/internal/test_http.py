@@ -0,0 +1,72 @@
+"""Tests for shared HTTP client configuration."""
+
+import subprocess
+import sys
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from fulcrum_sdk._internal import http as http_module
+from fulcrum_sdk._internal.http import create_async_http_client, create_http_client
+
+
+class TestCreateHttpClient:
+    """Tests for create_http_client()."""
+
+    def test_sets_user_agent_and_headers(self):
+        """Should merge custom headers over the SDK user agent."""
+        with create_http_client(headers={"X-Test": "1"}) as client:
+            assert client.headers["User-Agent"].startswith("fulcrum-sdk/")
+            assert client.headers["X-Test"] == "1"
+
+    def test_caps_connect_timeout(self):
+        """Should cap only the connect phase, keeping the full timeout for the rest."""
+        with create_http_client(timeout=1.5, connect_timeout=0.5) as client:
+            assert client.timeout == httpx.Timeout(1.5, connect=0.5)
+
+    def test_ignores_connect_timeout_above_timeout(self):
+        """Should never raise the connect limit above the overall timeout."""
+        with create_http_client(timeout=0.1, connect_timeout=0.5) as client:
+            assert client.timeout == httpx.Timeout(0.1)
+
+    @pytest.mark.skipif(not http_module.HTTP2_AVAILABLE, reason="h2 not installed")
+    def test_enables_http2_when_available(self):
+        """Should negotiate HTTP/2 when requested and h2 is installed."""
+        with create_http_client(http2=True) as client:
+            assert client._transport._pool._http2 is True
+
+    def test_falls_back_to_http1_without_h2(self):
+        """Should ignore the http2 flag when h2 is not installed."""
+        with (
+            patch.object(http_module, "HTTP2_AVAILABLE", False),
+            create_http_client(http2=True) as client,
+        ):
+            assert client._transport._pool._http2 is False
+
+
+class TestCreateAsyncHttpClient:
+    """Tests for create_async_http_client()."""
+
+    async def test_matches_sync_configuration(self):
+        """Should apply the same headers, timeouts and HTTP/2 setting as the sync client."""
+        async with create_async_http_client(
+            timeout=1.5, headers={"X-Test": "1"}, http2=True, connect_timeout=0.5
+        ) as client:
+            assert client.timeout == httpx.Timeout(1.5, connect=0.5)
+            assert client.headers["User-Agent"].startswith("fulcrum-sdk/")
+            assert client.headers["X-Test"] == "1"
+            assert client._transport._pool._http2 is http_module.HTTP2_AVAILABLE
+
+
+class TestLazyImport:
+    """Tests for deferring the httpx import."""
+
+    def test_clients_import_without_httpx(self):
+        """Should not import httpx until a client sends a request."""
+        code = (
+            "import sys\n"
+            "import fulcrum_sdk._internal.dispatch, fulcrum_sdk._internal.improvements\n"
+            "assert 'httpx' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,138 @@
+"""Tests for shared JSON serialization."""
+
+import importlib.util
+import sys
+from datetime import datetime
+from decimal import Decimal
+from pathlib import PurePosixPath
+from unittest.mock import patch
+from uuid import UUID
+
+import pytest
+from pydantic import BaseModel
+
+from fulcrum_sdk._internal import serialization
+from fulcrum_sdk._internal.serialization import append_field, dumps, loads
+
+
+def _load_without_orjson():
+    """Load a separate copy of the serialization module on its fallback backend."""
+    spec = importlib.util.spec_from_file_location(
+        "_serialization_without_orjson", serialization.__file__
+    )
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    with patch.dict(sys.modules, {"orjson": None}):
+        spec.loader.exec_module(module)
+    return module
+
+
+class TestDumps:
+    """Tests for dumps()."""
+
+    def test_compact_output(self):
+        """Should emit compact JSON bytes."""
+        assert dumps({"kind": "text", "count": 5}) == b'{"kind":"text","count":5}'
+
+    def test_utf8_output(self):
+        """Should emit non-ASCII characters as UTF-8."""
+        assert dumps({"name": "café"}) == '{"name":"café"}'.encode()
+
+    def test_datetime_and_uuid(self):
+        """Should encode datetimes as ISO strings and UUIDs as strings."""
+        uuid = UUID("12345678-1234-5678-1234-567812345678")
+        blob = dumps({"ts": datetime(2024, 1, 1, 12, 30), "uuid": uuid})
+        assert blob == b'{"ts":"2024-01-01T12:30:00","uuid":"' + str(uuid).encode() + b'"}'
+
+    def test_non_string_keys(self):
+        """Should stringify non-string dict keys."""
+        assert dumps({1: "one"}) == b'{"1":"one"}'
+
+    def test_extended_types(self):
+        """Should encode Decimals, paths, sets and Pydantic models."""
+
+        class Point(BaseModel):
+            x: int
+
+        blob = dumps({
+            "amount": Decimal("1.50"),
+            "path": PurePosixPath("/tmp/out"),
+            "tags": {"a"},
+            "point": Point(x=1),
+        })
+        assert blob == b'{"amount":"1.50","path":"/tmp/out","tags":["a"],"point":{"x":1}}'
+
+    def test_models_match_model_dump(self):
+        """Should encode models exactly as their JSON-mode dump."""
+
+        class Event(BaseModel):
+            at: datetime
+            amount: Decimal
+
+        event = Event(at=datetime(2024, 1, 1), amount=Decimal("2.5"))
+        assert loads(dumps([event])) == [event.model_dump(mode="json")]
+
+    def test_unknown_types_raise(self):
+        """Should reject unknown types instead of stringifying them."""
+
+        class Custom:
+            pass
+
+        with pytest.raises(TypeError):
+            dumps({"value": Custom()})
+
+
+class TestBackendParity:
+    """Tests that the orjson and pydantic-core backends accept the same values."""
+
+    def _backends(self):
+        return [serialization.dumps, _load_without_orjson().dumps]
+
+    def test_integers_beyond_64_bits(self):
+        """Should encode integers of any size, which orjson alone rejects."""
+        payload = {"big": 2**64, "small": -(2**63) - 1, "nested": [2**70]}
+        for backend in self._backends():
+            assert backend(payload) == (
+                b'{"big":18446744073709551616,"small":-9223372036854775809,'
+                b'"nested":[1180591620717411303424]}'
+            )
+
+    def test_utf8_bytes(self):
+        """Should encode UTF-8 bytes as strings and reject other bytes."""
+        for backend in self._backends():
+            assert backend({"raw": "café".encode()}) == '{"raw":"café"}'.encode()
+            with pytest.raises(TypeError):
+                backend({"raw": b"\xff"})
+
+    def test_non_finite_floats_encode_as_null(self):
+        """Should encode NaN and infinities as null, including on the big-int retry."""
+        for backend in self._backends():
+            assert backend({"nan": float("nan"), "inf": float("inf")}) == (
+                b'{"nan":null,"inf":null}'
+            )
+            assert backend({"big": 2**64, "neg": float("-inf")}) == (
+                b'{"big":18446744073709551616,"neg":null}'
+            )
+
+
+class TestLoads:
+    """Tests for loads()."""
+
+    def test_round_trip(self):
+        """Should parse what dumps() produces."""
+        payload = {"name": "café", "items": [1, 2.5, None, True], "nested": {"a": "b"}}
+        assert loads(dumps(payload)) == payload
+
+    def test_accepts_str(self):
+        """Should parse JSON text as well as bytes."""
+        assert loads('{"a":1}') == {"a": 1}
+
+
+class TestAppendField:
+    """Tests for append_field()."""
+
+    def test_appends_encoded_value(self):
+        """Should add the field last without re-encoding the value."""
+        blob = append_field(b'{"kind":"text"}', "payload", b'{"a":[1,2]}')
+        assert blob == b'{"kind":"text","payload":{"a":[1,2]}}'
+        assert loads(blob) == {"kind": "text", "payload": {"a": [1, 2]}}
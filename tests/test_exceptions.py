@@ -1,5 +1,7 @@
 """Tests for public exceptions."""
 
+import pickle
+
 import pytest
 
 from fulcrum_sdk.exceptions import (
@@ -43,6 +45,27 @@ class TestFulcrumAPIError:
         assert str(error) == "Not found"
         assert error.status_code == 404
 
+    def test_stores_status_code_in_slot(self):
+        """Should keep status_code out of the instance __dict__."""
+        error = FulcrumAPIError("Not found", status_code=404)
+        assert "status_code" in FulcrumAPIError.__slots__
+        assert error.__dict__ == {}
+
+    def test_pickle_round_trip(self):
+        """Should keep the message and status code through pickling."""
+        error = pickle.loads(pickle.dumps(FulcrumAPIError("Not found", status_code=404)))
+        assert isinstance(error, FulcrumAPIError)
+        assert str(error) == "Not found"
+        assert error.status_code == 404
+
+    def test_pickle_keeps_notes(self):
+        """Should keep notes and other instance attributes through pickling."""
+        error = FulcrumAPIError("Not found", status_code=404)
+        error.add_note("while listing improvements")
+        error = pickle.loads(pickle.dumps(error))
+        assert error.status_code == 404
+        assert error.__notes__ == ["while listing improvements"]
+
     def test_can_be_caught_as_fulcrum_error(self):
         """Should be catchable as FulcrumError."""
         with pytest.raises(FulcrumError):